@@ -2,53 +2,141 @@
 """
 TITAN MASTER ORCHESTRATOR V2 - COMPLETE WITH AI WEBSITE BUILDER
 - AI generates COMPLETE HTML/CSS/JS pages from master prompt
-- Variables: [title], [keyword], [city], [category], [emoji], [date]
+- Variables: $title, $keyword, $city, $category, $emoji, $date
 - 5 design templates rotate automatically
 - Unique content guaranteed
 - Blog articles + Podcasts + 100 SEO pages
 """
 import sys
 import os
+import argparse
 from pathlib import Path
-from datetime import datetime
-import base64
+from datetime import datetime, timezone
 import asyncio
 import hashlib
+import importlib.util
+import json
+import logging
+import re
+import sqlite3
+import string
+import threading
+import time
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from collections import OrderedDict
+from itertools import groupby, product
+from operator import itemgetter
 from typing import List, Dict, Set
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from titan_modules.core.multi_topic_generator import MultiTopicGenerator
 
-# Gemini
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+# Per-page progress goes through logging: %-args are only formatted if the level is on.
+# Handlers are configured in __main__, so importing this module leaves logging alone.
+log = logging.getLogger(__name__)
+
+
+class _StdoutBatchHandler(logging.StreamHandler):
+    """Log records go into stdout's own buffer, in order with print(); no flush syscall per record"""
+    
+    def flush(self):
+        pass
+
+
+def _module_available(name: str) -> bool:
+    """Check an optional dependency is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Gemini (imported on first use: the SDK pulls in a large gRPC stack)
+GEMINI_AVAILABLE = _module_available('google.generativeai')
+_genai = None
+
+
+def _lazy_genai():
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        _genai = genai
+    return _genai
+
+
+@lru_cache(maxsize=4)
+def _gemini_model(api_key: str):
+    """Configured Gemini model, created once per API key and reused by every request"""
+    genai = _lazy_genai()
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-1.5-flash')
+
 
 # Images
 import requests
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 
-# Audio
 try:
-    import edge_tts
-    EDGE_TTS_AVAILABLE = True
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# RSS
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
 except ImportError:
-    EDGE_TTS_AVAILABLE = False
+    from xml.etree import ElementTree as etree
+    LXML_AVAILABLE = False
+
+ITUNES_NS = 'http://www.itunes.com/dtds/podcast-1.0.dtd'
+ITUNES = '{' + ITUNES_NS + '}'
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+
+# Audio (imported on first use)
+EDGE_TTS_AVAILABLE = _module_available('edge_tts')
+_edge_tts = None
+
+
+def _lazy_edge_tts():
+    global _edge_tts
+    if _edge_tts is None:
+        import edge_tts
+        _edge_tts = edge_tts
+    return _edge_tts
 
 
 class ContentUniqueValidator:
     """Ensures all content is unique"""
     
     def __init__(self):
-        self.content_hashes: Set[str] = set()
+        self.content_hashes: Set[bytes] = set()
+        self.seen_keys: Set[bytes] = set()
+    
+    def reserve(self, key) -> bool:
+        """Claim a generation key before paying for the API call; False if already claimed"""
+        key_hash = hashlib.blake2b(repr(key).encode('utf-8', 'ignore'), digest_size=16).digest()
+        
+        if key_hash in self.seen_keys:
+            return False
+        
+        self.seen_keys.add(key_hash)
+        return True
     
     def is_unique(self, content: str, content_type: str) -> bool:
         """Check if content is unique"""
-        content_hash = hashlib.md5(content.encode()).hexdigest()
+        content_hash = hashlib.blake2b(content.encode('utf-8', 'ignore'), digest_size=16).digest()
         
         if content_hash in self.content_hashes:
             print(f"      ⚠️ Duplicate {content_type}! Regenerating...")
@@ -58,6 +146,153 @@ class ContentUniqueValidator:
         return True
 
 
+class GeminiCache:
+    """On-disk cache of generated pages, keyed by a hash of the full prompt"""
+    
+    def __init__(self, path: str = '.gemini_cache.sqlite'):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS responses (key BLOB PRIMARY KEY, html TEXT, ts INT)')
+    
+    @staticmethod
+    def key(prompt: str) -> bytes:
+        return hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).digest()
+    
+    def get(self, key: bytes):
+        row = self.conn.execute('SELECT html FROM responses WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: bytes, html: str):
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?)', (key, html, int(time.time())))
+    
+    def close(self):
+        self.conn.close()
+
+
+class PhotoCache:
+    """Downloaded stock photos keyed by source + keyword + size, bounded in memory and (via prune) on disk; entries expire after max_age seconds"""
+    
+    def __init__(self, path: str = '.photo_cache', max_memory: int = 32, max_files: int = 256, max_age: int = 7 * 24 * 3600):
+        self.dir = Path(path)
+        self.memory: OrderedDict = OrderedDict()
+        self.max_memory = max_memory
+        self.max_files = max_files
+        self.max_age = max_age
+        self._dir_ready = False
+        # get/set run in worker threads for concurrent topics
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(source: str, keyword: str, width: int, height: int) -> str:
+        return hashlib.blake2b(f"{source}|{keyword}|{width}|{height}".encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, key: str):
+        with self._lock:
+            data = self.memory.get(key)
+            if data is not None:
+                self.memory.move_to_end(key)
+                return data
+        path = self.dir / f'{key}.jpg'
+        try:
+            # Expired photos count as a miss so the keyword gets a fresh random photo
+            if time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+    
+    def set(self, key: str, data: bytes):
+        """Store a photo; callers only pass bytes that have already decoded"""
+        self._remember(key, data)
+        if not self._dir_ready:
+            self.dir.mkdir(exist_ok=True)
+            self._dir_ready = True
+        (self.dir / f'{key}.jpg').write_bytes(data)
+    
+    def discard(self, key: str):
+        with self._lock:
+            self.memory.pop(key, None)
+        (self.dir / f'{key}.jpg').unlink(missing_ok=True)
+    
+    def _remember(self, key: str, data: bytes):
+        with self._lock:
+            self.memory[key] = data
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_memory:
+                self.memory.popitem(last=False)
+    
+    def prune(self):
+        """Drop expired files, then the oldest ones beyond max_files; run once at startup"""
+        now = time.time()
+        entries = []
+        for path in self.dir.glob('*.jpg'):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        entries.sort()
+        excess = len(entries) - self.max_files
+        for i, (mtime, path) in enumerate(entries):
+            if i < excess or now - mtime > self.max_age:
+                path.unlink(missing_ok=True)
+
+
+# Bump when the article prompt, podcast script or hero branding changes, so .topic_cache entries are rebuilt
+TEMPLATE_VERSION = 1
+
+
+class TopicCache:
+    """Article, hero and podcast of each finished topic, so a same-day re-run doesn't regenerate it"""
+    
+    def __init__(self, path: str = '.topic_cache', max_age: int = 2 * 24 * 3600):
+        self.dir = Path(path)
+        self.max_age = max_age
+        self._dir_ready = False
+    
+    @staticmethod
+    def key(topic: dict, episode_num: int, run_date: str) -> str:
+        # The episode number is spoken in the podcast script; the date keeps other days' runs unique
+        fields = json.dumps({k: v for k, v in topic.items() if k != 'slug'}, sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(f"{TEMPLATE_VERSION}|{run_date}|{fields}|{episode_num}".encode('utf-8'), digest_size=16).hexdigest()
+    
+    def prune(self):
+        """Delete entries older than max_age; keys from earlier days can never hit again"""
+        cutoff = time.time() - self.max_age
+        for path in self.dir.glob('*'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+    
+    def get(self, key: str):
+        """(article, hero_image, podcast or None), or None on a miss"""
+        try:
+            meta = json.loads((self.dir / f'{key}.json').read_text(encoding='utf-8'))
+            hero_image = (self.dir / f'{key}.jpg').read_bytes()
+            podcast = None
+            if meta.get('duration') is not None:
+                podcast = {'audio': (self.dir / f'{key}.mp3').read_bytes(), 'duration': meta['duration']}
+        except (OSError, ValueError):
+            return None
+        return meta['article'], hero_image, podcast
+    
+    def set(self, key: str, article: dict, hero_image: bytes, podcast: dict = None):
+        if not self._dir_ready:
+            self.dir.mkdir(exist_ok=True)
+            self._dir_ready = True
+        (self.dir / f'{key}.jpg').write_bytes(hero_image)
+        if podcast:
+            (self.dir / f'{key}.mp3').write_bytes(podcast['audio'])
+        # Metadata last: a half-written entry reads as a miss
+        meta = {'article': article, 'duration': podcast['duration'] if podcast else None}
+        (self.dir / f'{key}.json').write_text(json.dumps(meta, ensure_ascii=False), encoding='utf-8')
+
+
 class AIWebsiteBuilder:
     """
     AI Website Builder - generates COMPLETE HTML/CSS/JS pages
@@ -103,22 +338,22 @@ class AIWebsiteBuilder:
         }
     ]
     
-    # MASTER PROMPT with variables
+    # MASTER PROMPT with $variables
     MASTER_PROMPT = """You are an expert web designer creating a COMPLETE, PRODUCTION-READY HTML page.
 
-DESIGN TEMPLATE: {design_name}
-Design Description: {design_description}
-Color Palette: {design_colors}
-Typography: {design_fonts}
-Overall Vibe: {design_vibe}
+DESIGN TEMPLATE: $design_name
+Design Description: $design_description
+Color Palette: $design_colors
+Typography: $design_fonts
+Overall Vibe: $design_vibe
 
 PAGE VARIABLES:
-- Title: [title]
-- Keyword: [keyword]
-- Location: [city]
-- Category: [category]
-- Emoji: [emoji]
-- Date: [date]
+- Title: $title
+- Keyword: $keyword
+- Location: $city
+- Category: $category
+- Emoji: $emoji
+- Date: $date
 
 YOUR TASK:
 Create a COMPLETE HTML document (with embedded CSS and JavaScript) for a gift guide page.
@@ -128,26 +363,26 @@ REQUIREMENTS:
 1. COMPLETE HTML STRUCTURE
    - Full <!DOCTYPE html> document
    - All meta tags (title, description, viewport, keywords)
-   - Title: "[title] | SayPlay Gift Guide"
-   - Description: "Find perfect [keyword] in [city]. Personalized voice message gifts with SayPlay."
+   - Title: "$title | SayPlay Gift Guide"
+   - Description: "Find perfect $keyword in $city. Personalized voice message gifts with SayPlay."
    - Font Awesome CDN for icons
-   - Google Fonts for typography ({design_fonts})
+   - Google Fonts for typography ($design_fonts)
 
 2. HERO SECTION
-   - Full-width hero matching {design_vibe} aesthetic
-   - Colors from palette: {design_colors}
+   - Full-width hero matching $design_vibe aesthetic
+   - Colors from palette: $design_colors
    - Large "SayPlay" logo (Say in white, Play in gold #FFD700)
-   - Main heading: [title]
-   - Subheading: "Personalized Gifts with Voice Messages in [city]"
+   - Main heading: $title
+   - Subheading: "Personalized Gifts with Voice Messages in $city"
 
 3. CONTENT SECTIONS (800-1000 words)
    
    Introduction (2 paragraphs)
-   - Emotional hook about [keyword] in [city]
+   - Emotional hook about $keyword in $city
    - Why personalization matters
    
-   Why [city] is Special for Gifts (2 paragraphs)
-   - Specific local references to [city]
+   Why $city is Special for Gifts (2 paragraphs)
+   - Specific local references to $city
    - Shopping areas and culture
    
    Top 6 Gift Ideas (cards/boxes)
@@ -159,28 +394,28 @@ REQUIREMENTS:
    - Personalized Items
    - Plants & Flowers
    - 80-100 words each
-   - Specific to [category]
+   - Specific to $category
    
    How SayPlay Works (3 steps)
    - Record Your Message
    - Attach to Gift
    - They Tap & Listen
    
-   Shopping in [city] (1 paragraph)
+   Shopping in $city (1 paragraph)
    - Local shopping references
    
    Call to Action Section
    - Large CTA box with gradient from palette
-   - Gift icon [emoji]
-   - "Make Your Gift Special in [city]"
+   - Gift icon $emoji
+   - "Make Your Gift Special in $city"
    - Button: "Get Started with SayPlay →"
    - Link: https://sayplay.co.uk
 
 4. CSS STYLING (embedded in <style>)
-   - Use {design_name} aesthetic EXACTLY
-   - Colors: {design_colors}
-   - Fonts: {design_fonts} (import from Google Fonts)
-   - Match {design_vibe} vibe completely
+   - Use $design_name aesthetic EXACTLY
+   - Colors: $design_colors
+   - Fonts: $design_fonts (import from Google Fonts)
+   - Match $design_vibe vibe completely
    - Responsive (mobile, tablet, desktop)
    - Smooth transitions and hover effects
    - Modern CSS (flexbox, grid, animations)
@@ -221,15 +456,77 @@ Start with <!DOCTYPE html> and end with </html>
 Do NOT include markdown formatting or explanations.
 Do NOT wrap in code blocks.
 Just pure HTML code ready to save as .html file."""
-
+    _PROMPT_TEMPLATE = string.Template(MASTER_PROMPT)
+    
+    # Body of the first ``` / ```html code block in a response
+    _CODEFENCE_RE = re.compile(r'```(?:html)?(.*?)(?:```|\Z)', re.DOTALL)
+    
+    # Gemini requests allowed in flight at once (RPM quota)
+    MAX_CONCURRENT_REQUESTS = 10
+    
+    # Stand-in for the city in cached fallback skeletons
+    CITY_SENTINEL = '__CITY__'
+    
+    # Stylesheet shared by every fallback page, written once as /seo/fallback.css
+    FALLBACK_CSS = '''* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; line-height: 1.8; color: #2d3748; }
+.hero { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 100px 30px; text-align: center; }
+.logo { font-size: 56px; font-weight: 800; margin-bottom: 25px; }
+.logo span { color: #FFD700; }
+h1 { font-size: 48px; margin: 25px 0; font-weight: 900; }
+.container { max-width: 900px; margin: 80px auto; padding: 0 30px; }
+h2 { color: #667eea; font-size: 36px; margin: 50px 0 25px; font-weight: 800; }
+p { font-size: 19px; margin-bottom: 20px; line-height: 1.8; }
+.cta { background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 70px 50px; border-radius: 25px; text-align: center; margin: 70px 0; }
+.cta a { display: inline-flex; align-items: center; gap: 12px; background: white; color: #667eea; padding: 20px 50px; border-radius: 50px; text-decoration: none; font-weight: 800; font-size: 20px; }
+'''
+    
+    # Static page used when Gemini is unavailable, filled with str.format
+    _FALLBACK_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} | SayPlay</title>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="stylesheet" href="/seo/fallback.css">
+</head>
+<body>
+    <div class="hero">
+        <div class="logo">Say<span>Play</span></div>
+        <h1>{emoji} {title}</h1>
+        <p>Personalized Gifts with Voice Messages in {city}</p>
+    </div>
+    <div class="container">
+        <a href="/seo" style="color: #667eea; text-decoration: none; font-weight: 600;">← Back to all locations</a>
+        <h2>Perfect {keyword} in {city}</h2>
+        <p>Looking for unique {keyword} in {city}? Discover thoughtful gift ideas with personalized voice messages from SayPlay.</p>
+        <div class="cta">
+            <i class="fas fa-gift" style="font-size: 70px; margin-bottom: 25px;"></i>
+            <h3 style="color: white; font-size: 36px; margin-bottom: 20px;">Make Your Gift Special</h3>
+            <p style="color: white; font-size: 20px; margin-bottom: 35px;">Add a personal voice message with SayPlay</p>
+            <a href="https://sayplay.co.uk">Get Started <i class="fas fa-arrow-right"></i></a>
+        </div>
+    </div>
+</body>
+</html>'''
+    
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
         
         if GEMINI_AVAILABLE and self.api_key:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-1.5-flash')
+            self.model = _gemini_model(self.api_key)
+            self.cache = GeminiCache()
         else:
             self.model = None
+            self.cache = None
+        self._skeletons = {}
+    
+    def close(self):
+        """Release the response cache's SQLite connection"""
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
     
     def build_page(self, variables: Dict[str, str], template_index: int) -> str:
         """
@@ -244,50 +541,109 @@ Just pure HTML code ready to save as .html file."""
         """
         
         if not self.model:
-            return self._generate_fallback(variables)
-        
-        # Select design template (rotate)
-        template = self.DESIGN_TEMPLATES[template_index % len(self.DESIGN_TEMPLATES)]
-        
-        print(f"      🎨 AI Building: {variables['title']}")
-        print(f"         Design: {template['name']}")
-        
-        # Fill master prompt with template details
-        prompt = self.MASTER_PROMPT.format(
-            design_name=template['name'],
-            design_description=template['description'],
-            design_colors=template['colors'],
-            design_fonts=template['fonts'],
-            design_vibe=template['vibe']
-        )
+            return self._fallback_page(variables)
         
-        # Replace all [variables] in prompt
-        for key, value in variables.items():
-            prompt = prompt.replace(f'[{key}]', str(value))
+        prompt = self._build_prompt(variables, template_index)
+        cache_key = self.cache.key(prompt)
+        cached = self.cache.get(cache_key)
+        if cached:
+            log.info("         ♻️ Cached HTML: %s", variables['title'])
+            return cached
         
         try:
             # Generate complete page with AI
             response = self.model.generate_content(prompt)
-            html_code = response.text
-            
-            # Clean up if wrapped in code blocks
-            if '```html' in html_code:
-                html_code = html_code.split('```html')[1].split('```')[0].strip()
-            elif '```' in html_code:
-                html_code = html_code.split('```')[1].split('```')[0].strip()
-            
-            # Verify it starts with DOCTYPE
-            if not html_code.strip().startswith('<!DOCTYPE'):
-                print(f"         ⚠️ AI output missing DOCTYPE, using fallback")
-                return self._generate_fallback(variables)
+            return self._extract_html(response.text, variables, cache_key)
             
-            print(f"         ✅ AI generated complete HTML")
-            return html_code
+        except Exception as e:
+            log.warning("         ⚠️ AI error: %.80s", e)
+            return self._generate_fallback(variables)
+    
+    async def build_page_async(self, variables: Dict[str, str], template_index: int, semaphore: asyncio.Semaphore) -> str:
+        """Same as build_page, but awaits Gemini so many pages can be in flight at once"""
+        
+        if not self.model:
+            return self._fallback_page(variables)
+        
+        prompt = self._build_prompt(variables, template_index)
+        cache_key = self.cache.key(prompt)
+        cached = self.cache.get(cache_key)
+        if cached:
+            log.info("         ♻️ Cached HTML: %s", variables['title'])
+            return cached
+        
+        try:
+            async with semaphore:
+                response = await self.model.generate_content_async(prompt)
+            return self._extract_html(response.text, variables, cache_key)
             
         except Exception as e:
-            print(f"         ⚠️ AI error: {str(e)[:80]}")
+            log.warning("         ⚠️ AI error: %.80s", e)
             return self._generate_fallback(variables)
     
+    async def build_pages_batch(self, items: List[Dict[str, str]]) -> List[str]:
+        """Build all pages concurrently; item i uses design template i (rotating)"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return await asyncio.gather(*(
+            self.build_page_async(variables, template_index, semaphore)
+            for template_index, variables in enumerate(items)
+        ))
+    
+    def _build_prompt(self, variables: Dict[str, str], template_index: int) -> str:
+        """Fill the master prompt for one page"""
+        
+        # Select design template (rotate)
+        design_index = template_index % len(self.DESIGN_TEMPLATES)
+        
+        log.info("      🎨 AI Building: %s (design=%s)", variables['title'], self.DESIGN_TEMPLATES[design_index]['name'])
+        
+        # Design details are already filled in; only the page $variables remain
+        return self._design_prompts[design_index].safe_substitute(variables)
+    
+    @cached_property
+    def _design_prompts(self) -> List[string.Template]:
+        """Master prompt per design template, with the $design_* fields filled in once"""
+        return [
+            string.Template(self._PROMPT_TEMPLATE.safe_substitute(
+                design_name=template['name'],
+                design_description=template['description'],
+                design_colors=template['colors'],
+                design_fonts=template['fonts'],
+                design_vibe=template['vibe']
+            ))
+            for template in self.DESIGN_TEMPLATES
+        ]
+    
+    def _extract_html(self, html_code: str, variables: Dict[str, str], cache_key: bytes) -> str:
+        """Strip code fences from the AI response, check it is a full document and cache it"""
+        
+        # Clean up if wrapped in code blocks
+        fenced = self._CODEFENCE_RE.search(html_code)
+        if fenced:
+            html_code = fenced.group(1).strip()
+        
+        # Verify it starts with DOCTYPE
+        if not html_code.lstrip().startswith('<!DOCTYPE'):
+            log.warning("         ⚠️ AI output missing DOCTYPE (%s), using fallback", variables['title'])
+            return self._generate_fallback(variables)
+        
+        log.info("         ✅ AI generated complete HTML: %s", variables['title'])
+        self.cache.set(cache_key, html_code)
+        return html_code
+    
+    def _fallback_page(self, variables: Dict[str, str]) -> str:
+        """Fallback page rendered once per gift type, with only the city swapped in"""
+        
+        city = variables.get('city', 'UK')
+        skeleton_vars = {k: v.replace(city, self.CITY_SENTINEL) for k, v in variables.items()}
+        skeleton_vars['city'] = self.CITY_SENTINEL
+        key = tuple(sorted(skeleton_vars.items()))
+        
+        skeleton = self._skeletons.get(key)
+        if skeleton is None:
+            skeleton = self._skeletons[key] = self._generate_fallback(skeleton_vars)
+        return skeleton.replace(self.CITY_SENTINEL, city)
+    
     def _generate_fallback(self, variables: Dict[str, str]) -> str:
         """Fallback if AI fails"""
         
@@ -296,54 +652,29 @@ Just pure HTML code ready to save as .html file."""
         city = variables.get('city', 'UK')
         emoji = variables.get('emoji', '🎁')
         
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} | SayPlay</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; line-height: 1.8; color: #2d3748; }}
-        .hero {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 100px 30px; text-align: center; }}
-        .logo {{ font-size: 56px; font-weight: 800; margin-bottom: 25px; }}
-        .logo span {{ color: #FFD700; }}
-        h1 {{ font-size: 48px; margin: 25px 0; font-weight: 900; }}
-        .container {{ max-width: 900px; margin: 80px auto; padding: 0 30px; }}
-        h2 {{ color: #667eea; font-size: 36px; margin: 50px 0 25px; font-weight: 800; }}
-        p {{ font-size: 19px; margin-bottom: 20px; line-height: 1.8; }}
-        .cta {{ background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 70px 50px; border-radius: 25px; text-align: center; margin: 70px 0; }}
-        .cta a {{ display: inline-flex; align-items: center; gap: 12px; background: white; color: #667eea; padding: 20px 50px; border-radius: 50px; text-decoration: none; font-weight: 800; font-size: 20px; }}
-    </style>
-</head>
-<body>
-    <div class="hero">
-        <div class="logo">Say<span>Play</span></div>
-        <h1>{emoji} {title}</h1>
-        <p>Personalized Gifts with Voice Messages in {city}</p>
-    </div>
-    <div class="container">
-        <a href="/seo" style="color: #667eea; text-decoration: none; font-weight: 600;">← Back to all locations</a>
-        <h2>Perfect {keyword} in {city}</h2>
-        <p>Looking for unique {keyword} in {city}? Discover thoughtful gift ideas with personalized voice messages from SayPlay.</p>
-        <div class="cta">
-            <i class="fas fa-gift" style="font-size: 70px; margin-bottom: 25px;"></i>
-            <h3 style="color: white; font-size: 36px; margin-bottom: 20px;">Make Your Gift Special</h3>
-            <p style="color: white; font-size: 20px; margin-bottom: 35px;">Add a personal voice message with SayPlay</p>
-            <a href="https://sayplay.co.uk">Get Started <i class="fas fa-arrow-right"></i></a>
-        </div>
-    </div>
-</body>
-</html>'''
+        return self._FALLBACK_TEMPLATE.format(title=title, keyword=keyword, city=city, emoji=emoji)
 
 
 class ProfessionalImageGenerator:
     """Generate images with SayPlay branding"""
     
+    FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+    FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+    
+    # Loaded fonts and measured text widths, shared by every image
+    _FONT_CACHE: Dict[tuple, ImageFont.ImageFont] = {}
+    _TEXT_WIDTH_CACHE: Dict[tuple, int] = {}
+    
     def __init__(self):
         self.unsplash_key = os.getenv('UNSPLASH_ACCESS_KEY', '')
         self.pexels_key = os.getenv('PEXELS_API_KEY', '')
+        
+        # Keep-alive session: API + CDN connections are reused across images
+        self.sess = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20)
+        self.sess.mount('https://', adapter)
+        self._aio_session = None
+        self.photo_cache = PhotoCache()
     
     def generate_hero_image(self, keyword: str, seed: str = None) -> bytes:
         """Generate unique hero image"""
@@ -366,15 +697,121 @@ class ProfessionalImageGenerator:
         print(f"         ⚠️ Gradient fallback")
         return self._generate_gradient(1200, 630, seed)
     
+    async def generate_hero_image_async(self, keyword: str, seed: str = None) -> bytes:
+        """Same as generate_hero_image, with the API calls awaited on a shared aiohttp session"""
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.generate_hero_image, keyword, seed)
+        
+        print(f"      🖼 Generating image for: {keyword}")
+        
+        search_query = f"{keyword} {seed[:4] if seed else ''}"
+        
+        sources = []
+        if self.unsplash_key:
+            sources.append(('unsplash', 'Unsplash', self._fetch_unsplash_async, None))
+        if self.pexels_key:
+            sources.append(('pexels', 'Pexels', self._fetch_pexels_async, (1200, 630)))
+        
+        # Decoding and branding are CPU work, so they go to a worker thread;
+        # a body that won't decode falls through to the next source, like the requests path
+        for source, label, fetch, size in sources:
+            data, key, cached = await self._fetch_cached(source, fetch, keyword, search_query, 1200, 630)
+            if not data:
+                continue
+            try:
+                hero = await asyncio.to_thread(self._brand_photo, data, size)
+            except Exception as e:
+                print(f"         ⚠️ {label} photo unreadable: {str(e)[:60]}")
+                if cached:
+                    await asyncio.to_thread(self.photo_cache.discard, key)
+                continue
+            # Only photos that decoded are cached, so a bad download is never replayed
+            if not cached:
+                await asyncio.to_thread(self.photo_cache.set, key, data)
+            print(f"         ✅ {label} image")
+            return hero
+        
+        print(f"         ⚠️ Gradient fallback")
+        return await asyncio.to_thread(self._generate_gradient, 1200, 630, seed)
+    
+    def _http(self):
+        """Shared aiohttp session, opened on first use inside the running loop"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=5),
+                timeout=aiohttp.ClientTimeout(total=25)
+            )
+        return self._aio_session
+    
+    async def close(self):
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+    
+    async def _fetch_cached(self, source: str, fetch, keyword: str, query: str, width: int, height: int):
+        """(photo bytes, cache key, from cache) - the cache first, the API on a miss; the caller stores it once it decodes"""
+        # Keyed on the keyword, not the seeded query: the seed is time-based and would never repeat
+        key = self.photo_cache.key(source, keyword, width, height)
+        data = await asyncio.to_thread(self.photo_cache.get, key)
+        if data:
+            print(f"         ♻️ Cached {source} photo")
+            return data, key, True
+        return await fetch(query, width, height), key, False
+    
+    async def _fetch_unsplash_async(self, query: str, width: int, height: int):
+        try:
+            url = "https://api.unsplash.com/photos/random"
+            params = {'query': query, 'orientation': 'landscape', 'client_id': self.unsplash_key}
+            async with self._http().get(url, params=params, timeout=aiohttp.ClientTimeout(total=20)) as response:
+                if response.status != 200:
+                    return None
+                data = await response.json()
+            image_url = data['urls']['raw'] + f"&w={width}&h={height}&fit=crop"
+            async with self._http().get(image_url) as img_response:
+                if img_response.status == 200:
+                    return await img_response.read()
+        except Exception:
+            pass
+        return None
+    
+    async def _fetch_pexels_async(self, query: str, width: int, height: int):
+        try:
+            url = "https://api.pexels.com/v1/search"
+            headers = {'Authorization': self.pexels_key}
+            params = {'query': query, 'per_page': 1, 'orientation': 'landscape'}
+            async with self._http().get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=20)) as response:
+                if response.status != 200:
+                    return None
+                data = await response.json()
+            if data.get('photos'):
+                image_url = data['photos'][0]['src']['large2x']
+                async with self._http().get(image_url) as img_response:
+                    if img_response.status == 200:
+                        return await img_response.read()
+        except Exception:
+            pass
+        return None
+    
+    def _brand_photo(self, data: bytes, size: tuple = None) -> bytes:
+        """Decode a downloaded photo, optionally resize it, and add the logo overlay"""
+        img = Image.open(BytesIO(data))
+        if size:
+            # Let libjpeg decode at a reduced DCT scale when the photo is 2x+ the target
+            img.draft('RGB', size)
+            img = img.convert('RGB').resize(size, Image.Resampling.LANCZOS)
+        else:
+            img = img.convert('RGB')
+        return self._add_logo_overlay(img)
+    
     def _fetch_unsplash(self, query: str, width: int, height: int):
         try:
             url = "https://api.unsplash.com/photos/random"
             params = {'query': query, 'orientation': 'landscape', 'client_id': self.unsplash_key}
-            response = requests.get(url, params=params, timeout=20)
+            response = self.sess.get(url, params=params, timeout=20)
             if response.status_code == 200:
                 data = response.json()
                 image_url = data['urls']['raw'] + f"&w={width}&h={height}&fit=crop"
-                img_response = requests.get(image_url, timeout=25)
+                img_response = self.sess.get(image_url, timeout=25)
                 if img_response.status_code == 200:
                     return Image.open(BytesIO(img_response.content)).convert('RGB')
         except:
@@ -386,96 +823,132 @@ class ProfessionalImageGenerator:
             url = "https://api.pexels.com/v1/search"
             headers = {'Authorization': self.pexels_key}
             params = {'query': query, 'per_page': 1, 'orientation': 'landscape'}
-            response = requests.get(url, headers=headers, params=params, timeout=20)
+            response = self.sess.get(url, headers=headers, params=params, timeout=20)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('photos'):
                     image_url = data['photos'][0]['src']['large2x']
-                    img_response = requests.get(image_url, timeout=25)
+                    img_response = self.sess.get(image_url, timeout=25)
                     if img_response.status_code == 200:
-                        img = Image.open(BytesIO(img_response.content)).convert('RGB')
-                        return img.resize((width, height), Image.Resampling.LANCZOS)
+                        img = Image.open(BytesIO(img_response.content))
+                        img.draft('RGB', (width, height))
+                        return img.convert('RGB').resize((width, height), Image.Resampling.LANCZOS)
         except:
             pass
         return None
     
+    @classmethod
+    def _font(cls, path: str, size: int):
+        font = cls._FONT_CACHE.get((path, size))
+        if font is None:
+            try:
+                font = ImageFont.truetype(path, size)
+            except OSError:
+                font = ImageFont.load_default()
+            cls._FONT_CACHE[(path, size)] = font
+        return font
+    
+    @classmethod
+    def _text_width(cls, text: str, path: str, size: int) -> int:
+        width = cls._TEXT_WIDTH_CACHE.get((text, path, size))
+        if width is None:
+            bbox = cls._font(path, size).getbbox(text)
+            width = cls._TEXT_WIDTH_CACHE[(text, path, size)] = bbox[2] - bbox[0]
+        return width
+    
+    @staticmethod
+    def _gradient_image(width: int, height: int, start: tuple, delta: tuple) -> Image.Image:
+        """Vertical gradient: each row is start + delta * (y / height), computed once as a 1px column"""
+        progress = np.arange(height, dtype=np.float64)[:, None] / height
+        rows = (np.array(start, dtype=np.float64) + np.array(delta, dtype=np.float64) * progress).astype(np.uint8)
+        # Nearest-neighbour widening is a pure row copy inside PIL, no width-sized temporary in NumPy
+        return Image.fromarray(np.ascontiguousarray(rows[:, None, :]), 'RGB').resize((width, height), Image.NEAREST)
+    
     def _generate_gradient(self, width: int, height: int, seed: str = None) -> bytes:
+        offset = int(seed[:2], 16) if seed else 0
+        # Row colour = start + delta * progress; both are fixed per image
+        r0, g0, b0 = 102 + offset % 50, 126 + offset % 30, 234 - offset % 40
+        dr, dg, db = 118 - 102, 75 - 126, 162 - 234
+        if NUMPY_AVAILABLE:
+            img = self._gradient_image(width, height, (r0, g0, b0), (dr, dg, db))
+            return self._add_logo_overlay(img)
         img = Image.new('RGB', (width, height))
         draw = ImageDraw.Draw(img)
-        offset = int(seed[:2], 16) if seed else 0
         for y in range(height):
             progress = y / height
-            r = int((102 + offset % 50) + (118 - 102) * progress)
-            g = int((126 + offset % 30) + (75 - 126) * progress)
-            b = int((234 - offset % 40) + (162 - 234) * progress)
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
+            draw.line([(0, y), (width, y)], fill=(int(r0 + dr * progress), int(g0 + dg * progress), int(b0 + db * progress)))
         return self._add_logo_overlay(img)
     
+    @staticmethod
+    def _darken_bottom(img: Image.Image, gradient_start: int) -> Image.Image:
+        """Fade rows below gradient_start towards black in one NumPy pass, straight on RGB"""
+        arr = np.array(img)
+        # Rows above the band are untouched, so only the band is widened and blended
+        band = arr[gradient_start:].astype(np.uint32)
+        ramp = band.shape[0]
+        alpha = (200 * (np.arange(ramp) / ramp)).astype(np.uint32)
+        # Same integer rounding as Image.alpha_composite with a black overlay
+        tmp = band * ((255 - alpha) << 7)[:, None, None] + (0x80 << 7)
+        arr[gradient_start:] = (((tmp >> 8) + tmp) >> 8) >> 7
+        return Image.fromarray(arr, 'RGB')
+    
     def _add_logo_overlay(self, img: Image.Image) -> bytes:
         width, height = img.size
-        overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
         gradient_start = int(height * 0.65)
-        for y in range(gradient_start, height):
-            progress = (y - gradient_start) / (height - gradient_start)
-            alpha = int(200 * progress)
-            overlay_draw.rectangle([(0, y), (width, y+1)], fill=(0, 0, 0, alpha))
-        img = img.convert('RGBA')
-        img = Image.alpha_composite(img, overlay)
+        if NUMPY_AVAILABLE:
+            img = self._darken_bottom(img, gradient_start)
+        else:
+            overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+            overlay_draw = ImageDraw.Draw(overlay)
+            for y in range(gradient_start, height):
+                progress = (y - gradient_start) / (height - gradient_start)
+                alpha = int(200 * progress)
+                overlay_draw.rectangle([(0, y), (width, y+1)], fill=(0, 0, 0, alpha))
+            img = img.convert('RGBA')
+            img = Image.alpha_composite(img, overlay).convert('RGB')
         draw = ImageDraw.Draw(img)
-        try:
-            logo_size = max(40, int(height * 0.08))
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", logo_size)
-        except:
-            logo_size = 40
-            font = ImageFont.load_default()
+        logo_size = max(40, int(height * 0.08))
+        font = self._font(self.FONT_BOLD, logo_size)
         logo_x = width - int(width * 0.35)
         logo_y = height - int(height * 0.15)
         draw.text((logo_x, logo_y), "Say", fill=(255, 255, 255), font=font)
-        say_bbox = draw.textbbox((0, 0), "Say", font=font)
-        say_width = say_bbox[2] - say_bbox[0]
+        say_width = self._text_width("Say", self.FONT_BOLD, logo_size)
         draw.text((logo_x + say_width, logo_y), "Play", fill=(255, 215, 0), font=font)
-        img = img.convert('RGB')
         output = BytesIO()
-        img.save(output, format='JPEG', quality=92)
+        img.save(output, format='JPEG', quality=90, subsampling=2)
         return output.getvalue()
     
     def generate_podcast_cover(self, output_file: Path):
         print("\n🎨 Generating podcast cover (1400x1400)...")
-        img = Image.new('RGB', (1400, 1400))
-        draw = ImageDraw.Draw(img)
-        for y in range(1400):
-            progress = y / 1400
-            r = int(102 + (118 - 102) * progress)
-            g = int(126 + (75 - 126) * progress)
-            b = int(234 + (162 - 234) * progress)
-            draw.line([(0, y), (1400, y)], fill=(r, g, b))
-        try:
-            logo_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 200)
-            subtitle_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 70)
-            tagline_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 50)
-        except:
-            logo_font = ImageFont.load_default()
-            subtitle_font = logo_font
-            tagline_font = logo_font
+        if NUMPY_AVAILABLE:
+            img = self._gradient_image(1400, 1400, (102, 126, 234), (118 - 102, 75 - 126, 162 - 234))
+            draw = ImageDraw.Draw(img)
+        else:
+            img = Image.new('RGB', (1400, 1400))
+            draw = ImageDraw.Draw(img)
+            for y in range(1400):
+                progress = y / 1400
+                r = int(102 + (118 - 102) * progress)
+                g = int(126 + (75 - 126) * progress)
+                b = int(234 + (162 - 234) * progress)
+                draw.line([(0, y), (1400, y)], fill=(r, g, b))
+        logo_font = self._font(self.FONT_BOLD, 200)
+        subtitle_font = self._font(self.FONT_REGULAR, 70)
+        tagline_font = self._font(self.FONT_REGULAR, 50)
         say_text = "Say"
-        say_bbox = draw.textbbox((0, 0), say_text, font=logo_font)
-        say_width = say_bbox[2] - say_bbox[0]
+        say_width = self._text_width(say_text, self.FONT_BOLD, 200)
         play_text = "Play"
-        play_bbox = draw.textbbox((0, 0), play_text, font=logo_font)
-        play_width = play_bbox[2] - play_bbox[0]
+        play_width = self._text_width(play_text, self.FONT_BOLD, 200)
         total_width = say_width + play_width
         logo_x = (1400 - total_width) // 2
         logo_y = 350
         draw.text((logo_x, logo_y), say_text, fill=(255, 255, 255), font=logo_font)
         draw.text((logo_x + say_width, logo_y), play_text, fill=(255, 215, 0), font=logo_font)
         subtitle = "GIFT GUIDE"
-        subtitle_bbox = draw.textbbox((0, 0), subtitle, font=subtitle_font)
-        subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
+        subtitle_width = self._text_width(subtitle, self.FONT_REGULAR, 70)
         draw.text(((1400 - subtitle_width) // 2, 600), subtitle, fill=(255, 255, 255), font=subtitle_font)
         tagline = "Your Daily Inspiration for Perfect Gifts"
-        tagline_bbox = draw.textbbox((0, 0), tagline, font=tagline_font)
-        tagline_width = tagline_bbox[2] - tagline_bbox[0]
+        tagline_width = self._text_width(tagline, self.FONT_REGULAR, 50)
         draw.text(((1400 - tagline_width) // 2, 720), tagline, fill=(255, 255, 255), font=tagline_font)
         img.save(output_file, format='JPEG', quality=95)
         print(f"✅ Podcast cover saved")
@@ -484,93 +957,141 @@ class ProfessionalImageGenerator:
 class PodcastGeneratorWithJingles:
     """Generate 3-5 min podcasts with jingles"""
     
+    def __init__(self):
+        # (text, voice, rate) -> synthesis task for the shared intro/outro clips
+        self._jingles = {}
+    
+    # Episode script; only {episode_num}, {title} and {keyword} change per episode
+    _SCRIPT_TEMPLATE = " ".join([
+        "Hello and welcome to the SayPlay Gift Guide, episode {episode_num}.",
+        "I'm your host, and today we're exploring {title}.",
+        "",
+        "Finding the perfect gift can feel overwhelming. There are so many options, so many occasions, and so many people to shop for. But here's the secret: the best gifts aren't always the most expensive or the most elaborate. The best gifts are the ones that show genuine thought, care, and understanding of the person you're giving to.",
+        "",
+        "So let's talk about {keyword}. What makes a gift truly special? It starts with knowing the person. Think about their interests, their hobbies, what makes them smile.",
+        "",
+        "Let me share some ideas that really stand out.",
+        "",
+        "First, personalized items. A custom piece of jewelry with their initials, an engraved watch, or a photo album filled with shared memories. These gifts say I took the time to make this just for you.",
+        "",
+        "Second, experience gifts. Concert tickets to see their favorite band, a cooking class where they can learn something new, or a weekend getaway. Experiences create memories that last forever.",
+        "",
+        "Third, handmade gifts. If you're creative, consider making something yourself. A knitted scarf, a painted portrait, homemade treats. The time and effort shows a level of care that money can't buy.",
+        "",
+        "Fourth, subscription services. Monthly book clubs, specialty coffee delivery, streaming services. These are gifts that keep giving long after the initial occasion.",
+        "",
+        "Fifth, tech gadgets for those who love innovation. Smart home devices, wireless earbuds, tablets, or fitness trackers. Technology gifts can be both practical and exciting.",
+        "",
+        "Sixth, wellness and self-care gifts. Spa days, massage gift cards, aromatherapy sets, meditation app subscriptions. These gifts say I care about your wellbeing.",
+        "",
+        "Seventh, charitable gifts in their name. For the person who has everything, consider donating to a cause they care about.",
+        "",
+        "Now, here's where {keyword} become even more special. Think about the presentation. Beautiful wrapping, a heartfelt card, choosing the right moment.",
+        "",
+        "But there's something that takes personalization to an entirely new level: adding your voice. With SayPlay's innovative NFC technology, you can record a personal message and attach it to any gift.",
+        "",
+        "Imagine this: someone receives your gift, taps their phone on it, and instantly hears your voice sharing a memory, expressing your feelings, or simply saying why you chose that gift for them.",
+        "",
+        "No app download required. No complicated setup. Just pure, emotional connection.",
+        "",
+        "Your grandmother can hear your voice every time she looks at the photo frame you gave her. Your best friend can replay your message whenever they need encouragement. Your partner can hear you say I love you every anniversary.",
+        "",
+        "This technology transforms ordinary gifts into extraordinary keepsakes. It's not just about the physical item anymore, it's about the emotion, the story, the voice behind the gift.",
+        "",
+        "Let's talk about budget. Great gifts don't have to break the bank. Under thirty pounds, you can find meaningful books, artisan chocolates, plant gifts. Between thirty and one hundred pounds opens up jewelry, tech accessories, experience vouchers. And for luxury, watches, designer items, or once-in-a-lifetime experiences.",
+        "",
+        "The key is choosing something that fits your relationship with the person and shows you understand what makes them happy.",
+        "",
+        "A few mistakes to avoid: Don't give gift cards without personalization. Don't buy something you want for yourself. Don't wait until the last minute. And never underestimate the power of presentation.",
+        "",
+        "So as you think about {keyword}, remember: it's not about perfection, it's about connection. It's about showing someone you see them, you know them, and you care about them.",
+        "",
+        "That wraps up episode {episode_num} of the SayPlay Gift Guide. I hope these ideas have inspired you. Remember, the best gift is one given with love and thought.",
+        "",
+        "Thank you so much for listening. Until next time, happy gift giving, and remember: make every gift unforgettable."
+    ])
+    
     async def generate_podcast(self, article: dict, topic: dict, episode_num: int) -> dict:
         if not EDGE_TTS_AVAILABLE:
             return None
         print(f"      🎙 Generating podcast (3-5 min with jingles)...")
         script = self._create_extended_script(article, topic, episode_num)
         print(f"         🎵 Generating audio tracks...")
-        main_audio = await self._generate_audio(script, "en-GB-SoniaNeural")
         intro_script = "SayPlay Gift Guide. Where every gift tells a story."
-        intro_audio = await self._generate_audio(intro_script, "en-GB-RyanNeural", rate="-5%")
         outro_script = "SayPlay. Make every gift unforgettable. Visit sayplay dot co dot uk"
-        outro_audio = await self._generate_audio(outro_script, "en-GB-RyanNeural", rate="-5%")
-        combined_audio = intro_audio + main_audio + outro_audio
+        intro_audio, main_audio, outro_audio = await asyncio.gather(
+            self._jingle(intro_script, "en-GB-RyanNeural", rate="-5%"),
+            self._generate_audio(script, "en-GB-SoniaNeural"),
+            self._jingle(outro_script, "en-GB-RyanNeural", rate="-5%")
+        )
+        # edge-tts streams bare MP3 frames (no ID3/Xing header), so the tracks concatenate cleanly in one copy
+        combined_audio = b''.join((intro_audio, main_audio, outro_audio))
         word_count = len(script.split()) + 20
         duration_seconds = int((word_count / 150) * 60)
         print(f"         ✅ Podcast: {duration_seconds}s ({duration_seconds//60}m {duration_seconds%60}s)")
         return {'audio': combined_audio, 'duration': duration_seconds}
     
     def _create_extended_script(self, article: dict, topic: dict, episode_num: int) -> str:
-        parts = [
-            f"Hello and welcome to the SayPlay Gift Guide, episode {episode_num}.",
-            f"I'm your host, and today we're exploring {topic['title'].lower()}.",
-            "",
-            "Finding the perfect gift can feel overwhelming. There are so many options, so many occasions, and so many people to shop for. But here's the secret: the best gifts aren't always the most expensive or the most elaborate. The best gifts are the ones that show genuine thought, care, and understanding of the person you're giving to.",
-            "",
-            f"So let's talk about {topic['keyword']}. What makes a gift truly special? It starts with knowing the person. Think about their interests, their hobbies, what makes them smile.",
-            "",
-            "Let me share some ideas that really stand out.",
-            "",
-            "First, personalized items. A custom piece of jewelry with their initials, an engraved watch, or a photo album filled with shared memories. These gifts say I took the time to make this just for you.",
-            "",
-            "Second, experience gifts. Concert tickets to see their favorite band, a cooking class where they can learn something new, or a weekend getaway. Experiences create memories that last forever.",
-            "",
-            "Third, handmade gifts. If you're creative, consider making something yourself. A knitted scarf, a painted portrait, homemade treats. The time and effort shows a level of care that money can't buy.",
-            "",
-            "Fourth, subscription services. Monthly book clubs, specialty coffee delivery, streaming services. These are gifts that keep giving long after the initial occasion.",
-            "",
-            "Fifth, tech gadgets for those who love innovation. Smart home devices, wireless earbuds, tablets, or fitness trackers. Technology gifts can be both practical and exciting.",
-            "",
-            "Sixth, wellness and self-care gifts. Spa days, massage gift cards, aromatherapy sets, meditation app subscriptions. These gifts say I care about your wellbeing.",
-            "",
-            "Seventh, charitable gifts in their name. For the person who has everything, consider donating to a cause they care about.",
-            "",
-            f"Now, here's where {topic['keyword']} become even more special. Think about the presentation. Beautiful wrapping, a heartfelt card, choosing the right moment.",
-            "",
-            "But there's something that takes personalization to an entirely new level: adding your voice. With SayPlay's innovative NFC technology, you can record a personal message and attach it to any gift.",
-            "",
-            "Imagine this: someone receives your gift, taps their phone on it, and instantly hears your voice sharing a memory, expressing your feelings, or simply saying why you chose that gift for them.",
-            "",
-            "No app download required. No complicated setup. Just pure, emotional connection.",
-            "",
-            "Your grandmother can hear your voice every time she looks at the photo frame you gave her. Your best friend can replay your message whenever they need encouragement. Your partner can hear you say I love you every anniversary.",
-            "",
-            "This technology transforms ordinary gifts into extraordinary keepsakes. It's not just about the physical item anymore, it's about the emotion, the story, the voice behind the gift.",
-            "",
-            "Let's talk about budget. Great gifts don't have to break the bank. Under thirty pounds, you can find meaningful books, artisan chocolates, plant gifts. Between thirty and one hundred pounds opens up jewelry, tech accessories, experience vouchers. And for luxury, watches, designer items, or once-in-a-lifetime experiences.",
-            "",
-            "The key is choosing something that fits your relationship with the person and shows you understand what makes them happy.",
-            "",
-            "A few mistakes to avoid: Don't give gift cards without personalization. Don't buy something you want for yourself. Don't wait until the last minute. And never underestimate the power of presentation.",
-            "",
-            f"So as you think about {topic['keyword']}, remember: it's not about perfection, it's about connection. It's about showing someone you see them, you know them, and you care about them.",
-            "",
-            f"That wraps up episode {episode_num} of the SayPlay Gift Guide. I hope these ideas have inspired you. Remember, the best gift is one given with love and thought.",
-            "",
-            "Thank you so much for listening. Until next time, happy gift giving, and remember: make every gift unforgettable."
-        ]
-        return " ".join(parts)
+        return self._SCRIPT_TEMPLATE.format(
+            episode_num=episode_num,
+            title=topic['title'].lower(),
+            keyword=topic['keyword']
+        )
+    
+    async def _jingle(self, text: str, voice: str, rate: str = "+0%") -> bytes:
+        """Intro/outro clips are the same for every episode: synthesize each once and share the task"""
+        key = (text, voice, rate)
+        task = self._jingles.get(key)
+        if task is None:
+            task = self._jingles[key] = asyncio.ensure_future(self._generate_audio(text, voice, rate))
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            # Let the next episode retry instead of replaying the failure
+            if self._jingles.get(key) is task:
+                del self._jingles[key]
+            raise
     
     async def _generate_audio(self, text: str, voice: str, rate: str = "+0%") -> bytes:
-        communicate = edge_tts.Communicate(text, voice, rate=rate)
-        temp_file = f"temp_audio_{datetime.now().timestamp()}.mp3"
-        await communicate.save(temp_file)
-        with open(temp_file, 'rb') as f:
-            audio_data = f.read()
-        os.remove(temp_file)
-        return audio_data
+        communicate = _lazy_edge_tts().Communicate(text, voice, rate=rate)
+        # Keep the chunks as-is and copy them once in the join (a bytearray would copy again in bytes())
+        chunks = []
+        async for chunk in communicate.stream():
+            if chunk['type'] == 'audio':
+                chunks.append(chunk['data'])
+        return b''.join(chunks)
+
+
+_HEADER_RE = re.compile(r'^[^\S\n]*(#+)[^\S\n]*(.*)$', re.M)
+
+
+def _parse_sections(text: str) -> list:
+    """Split a markdown article into {'title', 'content'} sections at # headers"""
+    # re.split yields [body, hashes, title, body, hashes, title, body, ...]
+    parts = _HEADER_RE.split(text)
+    titles = [''] + [title.replace('#', '').strip() for title in parts[2::3]]
+    
+    sections = []
+    for title, body in zip(titles, parts[0::3]):
+        content = '\n'.join(line for line in map(str.strip, body.split('\n')) if line)
+        if content:
+            sections.append({'title': title, 'content': content})
+    
+    return sections
 
 
-def generate_unique_article(topic: dict, api_key: str, validator: ContentUniqueValidator, attempt: int = 1) -> dict:
+async def generate_unique_article(topic: dict, api_key: str, validator: ContentUniqueValidator, attempt: int = 1) -> dict:
     if not GEMINI_AVAILABLE or not api_key:
         return generate_fallback_article(topic)
     max_attempts = 3
     for i in range(max_attempts):
+        # Same topic already requested: don't pay for a second Gemini call
+        if not validator.reserve((topic['title'], topic['keyword'], attempt, i)):
+            print(f"      ⚠️ Duplicate topic, skipping Gemini")
+            return generate_fallback_article(topic)
         try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel('gemini-1.5-flash')
-            seed = hashlib.md5(f"{topic['title']}{datetime.now()}{attempt}{i}".encode()).hexdigest()
+            model = _gemini_model(api_key)
+            seed = hashlib.blake2b(f"{topic['title']}{datetime.now()}{attempt}{i}".encode(), digest_size=8).hexdigest()
             prompt = f"""Write a COMPLETELY UNIQUE article about: {topic['title']}
 
 Uniqueness Seed: {seed[:8]}
@@ -591,23 +1112,10 @@ STRUCTURE:
 
 Make it unique with unexpected examples, real stories, UK cultural references.
 Write naturally, warmly, helpfully."""
-            response = model.generate_content(prompt)
+            response = await model.generate_content_async(prompt)
             article_text = response.text
             if validator.is_unique(article_text, "article"):
-                sections = []
-                current = {'title': '', 'content': ''}
-                for line in article_text.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if line.startswith('##') or line.startswith('#'):
-                        if current['content']:
-                            sections.append(current)
-                        current = {'title': line.replace('#', '').strip(), 'content': ''}
-                    else:
-                        current['content'] += line + '\n'
-                if current['content']:
-                    sections.append(current)
+                sections = _parse_sections(article_text)
                 word_count = len(article_text.split())
                 print(f"      ✅ Unique article: {word_count} words")
                 return {
@@ -637,41 +1145,62 @@ def generate_fallback_article(topic: dict) -> dict:
     }
 
 
-def create_professional_html(article: dict, topic: dict, hero_base64: str) -> str:
-    html = f'''<!DOCTYPE html>
+_SLUG_TABLE = str.maketrans({' ': '-', "'": '', '"': '', '!': '', '?': '', ',': '', '.': '', ':': '', ';': ''})
+# Same mapping with A-Z lowercased too, so ASCII titles need no separate lower() pass
+_SLUG_ASCII_TABLE = str.maketrans({**{c: c.lower() for c in string.ascii_uppercase}, **_SLUG_TABLE})
+
+
+def _slugify(text: str) -> str:
+    """URL slug for a title or city name, in a single translate pass"""
+    if text.isascii():
+        return text.translate(_SLUG_ASCII_TABLE)[:60]
+    return text.lower().translate(_SLUG_TABLE)[:60]
+
+
+@lru_cache(maxsize=4096)
+def _esc(text: str) -> str:
+    """HTML-escape a line of article text (boilerplate lines repeat across articles)"""
+    return escape(text, quote=False)
+
+
+# Stylesheet shared by every blog article, written once as /blog/article.css
+_ARTICLE_CSS = '''* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; line-height: 1.8; color: #2d3748; background: #f7fafc; }
+.hero { position: relative; height: 600px; background: center/cover; display: flex; align-items: center; justify-content: center; }
+.hero-overlay { position: absolute; inset: 0; background: linear-gradient(180deg, rgba(0,0,0,0.2) 0%, rgba(0,0,0,0.7) 100%); }
+.hero-content { position: relative; z-index: 2; text-align: center; color: white; max-width: 900px; padding: 0 30px; }
+.logo { font-size: 56px; font-weight: 800; margin-bottom: 25px; text-shadow: 3px 3px 10px rgba(0,0,0,0.5); }
+.logo span { color: #FFD700; }
+h1 { font-size: 56px; font-weight: 900; margin-bottom: 25px; line-height: 1.15; text-shadow: 2px 2px 12px rgba(0,0,0,0.6); }
+.container { max-width: 900px; margin: -120px auto 80px; background: white; border-radius: 25px; box-shadow: 0 25px 70px rgba(0,0,0,0.15); padding: 70px 60px; position: relative; z-index: 3; }
+.content h2 { color: #667eea; font-size: 36px; font-weight: 800; margin: 60px 0 30px; padding-bottom: 18px; border-bottom: 4px solid #FFD700; }
+.content p { margin-bottom: 24px; font-size: 19px; line-height: 1.9; color: #4a5568; }
+.cta { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 70px 60px; border-radius: 25px; margin: 70px 0; text-align: center; }
+.cta a { display: inline-flex; align-items: center; gap: 15px; background: white; color: #667eea; padding: 22px 55px; border-radius: 50px; text-decoration: none; font-weight: 800; font-size: 22px; }
+@media (max-width: 768px) { .hero { height: 450px; } h1 { font-size: 36px; } .container { padding: 45px 30px; margin: -70px 20px 50px; } }
+'''
+
+_ARTICLE_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{article['title']} | SayPlay Gift Guide</title>
-    <meta name="description" content="{article['text'][:160]}...">
+    <title>{title} | SayPlay Gift Guide</title>
+    <meta name="description" content="{description}...">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; line-height: 1.8; color: #2d3748; background: #f7fafc; }}
-        .hero {{ position: relative; height: 600px; background: url('data:image/jpeg;base64,{hero_base64}') center/cover; display: flex; align-items: center; justify-content: center; }}
-        .hero-overlay {{ position: absolute; inset: 0; background: linear-gradient(180deg, rgba(0,0,0,0.2) 0%, rgba(0,0,0,0.7) 100%); }}
-        .hero-content {{ position: relative; z-index: 2; text-align: center; color: white; max-width: 900px; padding: 0 30px; }}
-        .logo {{ font-size: 56px; font-weight: 800; margin-bottom: 25px; text-shadow: 3px 3px 10px rgba(0,0,0,0.5); }}
-        .logo span {{ color: #FFD700; }}
-        h1 {{ font-size: 56px; font-weight: 900; margin-bottom: 25px; line-height: 1.15; text-shadow: 2px 2px 12px rgba(0,0,0,0.6); }}
-        .container {{ max-width: 900px; margin: -120px auto 80px; background: white; border-radius: 25px; box-shadow: 0 25px 70px rgba(0,0,0,0.15); padding: 70px 60px; position: relative; z-index: 3; }}
-        .content h2 {{ color: #667eea; font-size: 36px; font-weight: 800; margin: 60px 0 30px; padding-bottom: 18px; border-bottom: 4px solid #FFD700; }}
-        .content p {{ margin-bottom: 24px; font-size: 19px; line-height: 1.9; color: #4a5568; }}
-        .cta {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 70px 60px; border-radius: 25px; margin: 70px 0; text-align: center; }}
-        .cta a {{ display: inline-flex; align-items: center; gap: 15px; background: white; color: #667eea; padding: 22px 55px; border-radius: 50px; text-decoration: none; font-weight: 800; font-size: 22px; }}
-        @media (max-width: 768px) {{ .hero {{ height: 450px; }} h1 {{ font-size: 36px; }} .container {{ padding: 45px 30px; margin: -70px 20px 50px; }} }}
-    </style>
+    <link rel="stylesheet" href="/blog/article.css">
+    <link rel="preload" as="image" href="{hero_url}">
+    <style>.hero {{ background-image: url('{hero_url}'); }}</style>
 </head>
 <body>
     <div class="hero">
         <div class="hero-overlay"></div>
         <div class="hero-content">
             <div class="logo">Say<span>Play</span></div>
-            <h1>{article['title']}</h1>
+            <h1>{title}</h1>
             <div style="font-size: 17px; margin-top: 20px;">
-                <i class="far fa-calendar-alt"></i> {datetime.now().strftime("%B %d, %Y")} •
-                <i class="far fa-clock"></i> {max(1, article['word_count'] // 200)} min read
+                <i class="far fa-calendar-alt"></i> {date} •
+                <i class="far fa-clock"></i> {read_minutes} min read
             </div>
         </div>
     </div>
@@ -680,13 +1209,8 @@ def create_professional_html(article: dict, topic: dict, hero_base64: str) -> st
             <i class="fas fa-arrow-left"></i> Back to all articles
         </a>
         <div class="content">'''
-    for section in article['sections']:
-        if section['title']:
-            html += f"<h2>{section['title']}</h2>\n"
-        for para in section['content'].strip().split('\n'):
-            if para.strip():
-                html += f"<p>{para.strip()}</p>\n"
-    html += '''
+
+_ARTICLE_TAIL = '''
             <div class="cta">
                 <i class="fas fa-gift" style="font-size: 90px; margin-bottom: 30px;"></i>
                 <h3 style="color: white; font-size: 42px; margin-bottom: 25px; font-weight: 900;">Make Every Gift Unforgettable</h3>
@@ -697,10 +1221,38 @@ def create_professional_html(article: dict, topic: dict, hero_base64: str) -> st
     </div>
 </body>
 </html>'''
-    return html
 
 
-def generate_seo_pages_with_ai_builder(output_dir: Path, validator: ContentUniqueValidator, builder: AIWebsiteBuilder) -> List[Dict]:
+def create_professional_html(article: dict, topic: dict, hero_url: str, render_date: str = None) -> str:
+    parts = [_ARTICLE_HEAD.format(
+        title=article['title'],
+        description=escape(article['text'][:160]),
+        hero_url=hero_url,
+        date=render_date or datetime.now().strftime("%B %d, %Y"),
+        read_minutes=max(1, article['word_count'] // 200)
+    )]
+    for section in article['sections']:
+        if section['title']:
+            parts.append(f"<h2>{_esc(section['title'])}</h2>\n")
+        for para in section['content'].strip().split('\n'):
+            para = para.strip()
+            if para:
+                parts.append(f"<p>{_esc(para)}</p>\n")
+    parts.append(_ARTICLE_TAIL)
+    return ''.join(parts)
+
+
+def _write_page(item):
+    """Write one pre-encoded file straight to the fd: the payload is already complete, so a buffer would only copy it"""
+    path, data = item
+    view = memoryview(data)
+    with open(path, 'wb', buffering=0) as f:
+        # A raw write may be short; advance a view rather than slicing (and copying) the bytes
+        while view:
+            view = view[f.write(view):]
+
+
+async def generate_seo_pages_with_ai_builder(output_dir: Path, validator: ContentUniqueValidator, builder: AIWebsiteBuilder, render_date: str = None) -> List[Dict]:
     """Generate 100 SEO pages using AI Website Builder with master prompt"""
     
     print(f"\n{'='*70}")
@@ -727,43 +1279,44 @@ def generate_seo_pages_with_ai_builder(output_dir: Path, validator: ContentUniqu
     ]
     
     pages = []
-    page_index = 0
+    page_variables = []
+    render_date = render_date or datetime.now().strftime('%B %d, %Y')
+    city_pairs = [(city, _slugify(city)) for city in cities]
+    gift_keywords = [gift_type['slug'].replace('-', ' ') for gift_type in gift_types]
+    design_names = [template['name'] for template in builder.DESIGN_TEMPLATES]
     
-    for city in cities:
-        for gift_type in gift_types:
-            slug = f"{gift_type['slug']}-{city.lower().replace(' ', '-')}"
-            title = f"{gift_type['title']} in {city}"
-            
-            # Variables for master prompt
-            variables = {
-                'title': title,
-                'keyword': gift_type['slug'].replace('-', ' '),
-                'city': city,
-                'category': gift_type['title'],
-                'emoji': gift_type['emoji'],
-                'date': datetime.now().strftime('%B %d, %Y')
-            }
-            
-            # AI builds complete page (rotates through 5 designs)
-            html = builder.build_page(variables, page_index)
-            
-            # Save page
-            with open(seo_dir / f'{slug}.html', 'w', encoding='utf-8') as f:
-                f.write(html)
-            
-            # Get design name
-            template = builder.DESIGN_TEMPLATES[page_index % len(builder.DESIGN_TEMPLATES)]
-            
-            pages.append({
-                'slug': slug,
-                'title': title,
-                'city': city,
-                'category': gift_type['title'],
-                'url': f"/seo/{slug}.html",
-                'design': template['name']
-            })
-            
-            page_index += 1
+    for page_index, ((city, city_slug), (gift_type, keyword)) in enumerate(product(city_pairs, zip(gift_types, gift_keywords))):
+        slug = f"{gift_type['slug']}-{city_slug}"
+        title = f"{gift_type['title']} in {city}"
+        
+        # Variables for master prompt
+        page_variables.append({
+            'title': title,
+            'keyword': keyword,
+            'city': city,
+            'category': gift_type['title'],
+            'emoji': gift_type['emoji'],
+            'date': render_date
+        })
+        
+        pages.append({
+            'slug': slug,
+            'title': title,
+            'city': city,
+            'category': gift_type['title'],
+            'url': f"/seo/{slug}.html",
+            'design': design_names[page_index % len(design_names)]
+        })
+    
+    # AI builds all pages concurrently (rotates through 5 designs)
+    htmls = await builder.build_pages_batch(page_variables)
+    
+    # Save pages
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(_write_page, [
+            (seo_dir / 'fallback.css', builder.FALLBACK_CSS.encode('utf-8')),
+            *((seo_dir / f"{page['slug']}.html", html.encode('utf-8')) for page, html in zip(pages, htmls))
+        ]))
     
     print(f"\n✅ Generated {len(pages)} AI-powered SEO pages")
     print(f"   5 unique design styles rotating")
@@ -772,80 +1325,91 @@ def generate_seo_pages_with_ai_builder(output_dir: Path, validator: ContentUniqu
     return pages
 
 
-def create_rss_feed_apple(podcasts: List[Dict], output_file: Path, cover_url: str):
+def create_rss_feed_apple(podcasts: List[Dict], output_file: Path, cover_url: str, pub_date: str = None):
     print(f"\n📡 Generating Apple Podcasts RSS...")
-    from xml.etree.ElementTree import Element, SubElement, tostring
-    from xml.dom import minidom
-    rss = Element('rss', {'version': '2.0', 'xmlns:itunes': 'http://www.itunes.com/dtds/podcast-1.0.dtd', 'xmlns:content': 'http://purl.org/rss/1.0/modules/content/'})
-    channel = SubElement(rss, 'channel')
-    SubElement(channel, 'title').text = 'SayPlay Gift Guide'
+    # lxml takes the namespace map up front; ElementTree needs it registered
+    if LXML_AVAILABLE:
+        rss = etree.Element('rss', {'version': '2.0'}, nsmap={'itunes': ITUNES_NS, 'content': CONTENT_NS})
+    else:
+        etree.register_namespace('itunes', ITUNES_NS)
+        etree.register_namespace('content', CONTENT_NS)
+        rss = etree.Element('rss', {'version': '2.0'})
+    channel = etree.SubElement(rss, 'channel')
+    etree.SubElement(channel, 'title').text = 'SayPlay Gift Guide'
     description_text = """Your daily guide to perfect gifts, gift ideas, and personalization. 
 Discover thoughtful presents, creative gifting inspiration, and meaningful ways to personalize 
 every occasion. From birthdays to anniversaries, weddings to holidays - we help you find gifts 
 that create lasting memories with SayPlay voice message technology."""
-    SubElement(channel, 'description').text = description_text
-    SubElement(channel, 'link').text = 'https://dashboard.sayplay.co.uk'
-    SubElement(channel, 'language').text = 'en-GB'
-    SubElement(channel, 'itunes:author').text = 'SayPlay by VoiceGift UK'
-    SubElement(channel, 'itunes:summary').text = description_text
-    SubElement(channel, 'itunes:subtitle').text = 'Expert gift-giving tips and inspiration'
-    SubElement(channel, 'itunes:explicit').text = 'no'
-    SubElement(channel, 'itunes:image', {'href': cover_url})
-    category = SubElement(channel, 'itunes:category', {'text': 'Leisure'})
-    SubElement(category, 'itunes:category', {'text': 'Hobbies'})
-    owner = SubElement(channel, 'itunes:owner')
-    SubElement(owner, 'itunes:name').text = 'SayPlay'
-    SubElement(owner, 'itunes:email').text = 'podcast@sayplay.co.uk'
-    SubElement(channel, 'copyright').text = f'© {datetime.now().year} VoiceGift UK Ltd'
+    etree.SubElement(channel, 'description').text = description_text
+    etree.SubElement(channel, 'link').text = 'https://dashboard.sayplay.co.uk'
+    etree.SubElement(channel, 'language').text = 'en-GB'
+    etree.SubElement(channel, ITUNES + 'author').text = 'SayPlay by VoiceGift UK'
+    etree.SubElement(channel, ITUNES + 'summary').text = description_text
+    etree.SubElement(channel, ITUNES + 'subtitle').text = 'Expert gift-giving tips and inspiration'
+    etree.SubElement(channel, ITUNES + 'explicit').text = 'no'
+    etree.SubElement(channel, ITUNES + 'image', {'href': cover_url})
+    category = etree.SubElement(channel, ITUNES + 'category', {'text': 'Leisure'})
+    etree.SubElement(category, ITUNES + 'category', {'text': 'Hobbies'})
+    owner = etree.SubElement(channel, ITUNES + 'owner')
+    etree.SubElement(owner, ITUNES + 'name').text = 'SayPlay'
+    etree.SubElement(owner, ITUNES + 'email').text = 'podcast@sayplay.co.uk'
+    # One clock read for the copyright year and (if not given) the shared episode pubDate
+    now = datetime.now(timezone.utc)
+    etree.SubElement(channel, 'copyright').text = f'© {now.year} VoiceGift UK Ltd'
+    pub_date = pub_date or now.strftime('%a, %d %b %Y %H:%M:%S GMT')
     for podcast in podcasts:
-        item = SubElement(channel, 'item')
+        item = etree.SubElement(channel, 'item')
         episode_title = f"Episode {podcast['episode']}: {podcast['title']}"
-        SubElement(item, 'title').text = episode_title
+        etree.SubElement(item, 'title').text = episode_title
         episode_desc = f"Explore {podcast['title'].lower()}. Discover thoughtful gift ideas and creative ways to make your gifts memorable."
-        SubElement(item, 'description').text = episode_desc
-        SubElement(item, 'itunes:summary').text = episode_desc
-        SubElement(item, 'itunes:author').text = 'SayPlay'
-        SubElement(item, 'itunes:episode').text = str(podcast['episode'])
-        SubElement(item, 'itunes:episodeType').text = 'full'
-        SubElement(item, 'itunes:explicit').text = 'no'
-        SubElement(item, 'enclosure', {'url': f"https://dashboard.sayplay.co.uk/podcasts/{podcast['filename']}", 'length': str(podcast['size']), 'type': 'audio/mpeg'})
-        SubElement(item, 'guid').text = f"https://dashboard.sayplay.co.uk/podcasts/{podcast['filename']}"
-        SubElement(item, 'pubDate').text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-        SubElement(item, 'itunes:duration').text = str(podcast['duration'])
-    xml_string = minidom.parseString(tostring(rss, 'utf-8')).toprettyxml(indent='  ')
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(xml_string)
+        etree.SubElement(item, 'description').text = episode_desc
+        etree.SubElement(item, ITUNES + 'summary').text = episode_desc
+        etree.SubElement(item, ITUNES + 'author').text = 'SayPlay'
+        etree.SubElement(item, ITUNES + 'episode').text = str(podcast['episode'])
+        etree.SubElement(item, ITUNES + 'episodeType').text = 'full'
+        etree.SubElement(item, ITUNES + 'explicit').text = 'no'
+        episode_url = f"https://dashboard.sayplay.co.uk/podcasts/{podcast['filename']}"
+        etree.SubElement(item, 'enclosure', {'url': episode_url, 'length': str(podcast['size']), 'type': 'audio/mpeg'})
+        etree.SubElement(item, 'guid').text = episode_url
+        etree.SubElement(item, 'pubDate').text = pub_date
+        etree.SubElement(item, ITUNES + 'duration').text = str(podcast['duration'])
+    # Compact serialization; podcast clients don't need indentation
+    with open(output_file, 'wb') as f:
+        f.write(etree.tostring(rss, encoding='utf-8', xml_declaration=True))
     print(f"✅ Apple Podcasts RSS ({len(podcasts)} episodes)")
 
 
-def create_podcasts_index(podcasts: List[Dict], output_dir: Path):
-    print("📄 Creating /podcasts index...")
-    podcast_dir = output_dir / 'web' / 'podcasts'
-    html = f'''<!DOCTYPE html>
+# Rules shared by the podcasts, blog, SEO and dashboard index pages, served once as /assets/styles.css
+_INDEX_CSS = '''* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; }
+.logo { font-size: 56px; font-weight: 800; color: #667eea; text-align: center; margin-bottom: 15px; }
+.logo span { color: #FFD700; }
+.back-link { display: inline-flex; align-items: center; gap: 10px; color: #667eea; text-decoration: none; font-weight: 600; margin-bottom: 30px; }
+'''
+
+
+_PODCASTS_INDEX_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>SayPlay Gift Guide Podcast | All Episodes</title>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="stylesheet" href="/assets/styles.css">
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; min-height: 100vh; }}
-        .container {{ max-width: 1200px; margin: 0 auto; background: white; border-radius: 25px; padding: 50px; box-shadow: 0 25px 70px rgba(0,0,0,0.3); }}
-        .logo {{ font-size: 56px; font-weight: 800; color: #667eea; text-align: center; margin-bottom: 15px; }}
-        .logo span {{ color: #FFD700; }}
-        h1 {{ text-align: center; font-size: 42px; color: #2d3748; margin: 20px 0; font-weight: 900; }}
-        .subscribe-box {{ background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 40px; border-radius: 20px; text-align: center; margin-bottom: 50px; }}
-        .subscribe-links {{ display: flex; justify-content: center; gap: 20px; flex-wrap: wrap; margin-top: 25px; }}
-        .subscribe-btn {{ display: inline-flex; align-items: center; gap: 10px; background: white; color: #667eea; padding: 15px 30px; border-radius: 50px; text-decoration: none; font-weight: 700; }}
-        .episodes-list {{ display: grid; gap: 30px; }}
-        .episode-card {{ background: #f7fafc; border-radius: 20px; padding: 35px; border: 2px solid #e0e0e0; }}
-        .episode-header {{ display: flex; align-items: center; gap: 20px; margin-bottom: 20px; }}
-        .episode-number {{ background: linear-gradient(135deg, #667eea, #764ba2); color: white; width: 70px; height: 70px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 28px; font-weight: 800; }}
-        .episode-title {{ font-size: 24px; color: #2d3748; font-weight: 700; }}
-        audio {{ width: 100%; margin-top: 20px; }}
-        .back-link {{ display: inline-flex; align-items: center; gap: 10px; color: #667eea; text-decoration: none; font-weight: 600; margin-bottom: 30px; }}
-        @media (max-width: 768px) {{ .container {{ padding: 30px 20px; }} .episode-header {{ flex-direction: column; }} }}
+        body { min-height: 100vh; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 25px; padding: 50px; box-shadow: 0 25px 70px rgba(0,0,0,0.3); }
+        h1 { text-align: center; font-size: 42px; color: #2d3748; margin: 20px 0; font-weight: 900; }
+        .subscribe-box { background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 40px; border-radius: 20px; text-align: center; margin-bottom: 50px; }
+        .subscribe-links { display: flex; justify-content: center; gap: 20px; flex-wrap: wrap; margin-top: 25px; }
+        .subscribe-btn { display: inline-flex; align-items: center; gap: 10px; background: white; color: #667eea; padding: 15px 30px; border-radius: 50px; text-decoration: none; font-weight: 700; }
+        .episodes-list { display: grid; gap: 30px; }
+        .episode-card { background: #f7fafc; border-radius: 20px; padding: 35px; border: 2px solid #e0e0e0; }
+        .episode-header { display: flex; align-items: center; gap: 20px; margin-bottom: 20px; }
+        .episode-number { background: linear-gradient(135deg, #667eea, #764ba2); color: white; width: 70px; height: 70px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 28px; font-weight: 800; }
+        .episode-title { font-size: 24px; color: #2d3748; font-weight: 700; }
+        audio { width: 100%; margin-top: 20px; }
+        @media (max-width: 768px) { .container { padding: 30px 20px; } .episode-header { flex-direction: column; } }
     </style>
 </head>
 <body>
@@ -864,58 +1428,58 @@ def create_podcasts_index(podcasts: List[Dict], output_dir: Path):
         </div>
         <h2 style="font-size: 32px; color: #2d3748; margin-bottom: 30px;"><i class="fas fa-list"></i> All Episodes</h2>
         <div class="episodes-list">'''
-    for podcast in podcasts:
-        duration_min = podcast['duration'] // 60
-        duration_sec = podcast['duration'] % 60
-        html += f'''
+
+_EPISODE_CARD_TPL = '''
             <div class="episode-card">
                 <div class="episode-header">
-                    <div class="episode-number">{podcast['episode']}</div>
+                    <div class="episode-number">{episode}</div>
                     <div>
-                        <div class="episode-title">{podcast['title']}</div>
+                        <div class="episode-title">{title}</div>
                         <div style="color: #718096; margin-top: 8px;">
                             <i class="far fa-clock"></i> {duration_min}m {duration_sec}s
                         </div>
                     </div>
                 </div>
                 <audio controls preload="metadata">
-                    <source src="/podcasts/{podcast['filename']}" type="audio/mpeg">
+                    <source src="/podcasts/{filename}" type="audio/mpeg">
                 </audio>
             </div>'''
-    html += '''
+
+_PODCASTS_INDEX_TAIL = '''
         </div>
     </div>
 </body>
 </html>'''
-    with open(podcast_dir / 'index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
+
+
+def create_podcasts_index(podcasts: List[Dict], output_dir: Path):
+    print("📄 Creating /podcasts index...")
+    podcast_dir = output_dir / 'web' / 'podcasts'
+    # Stream fragments into a 64 KiB buffer instead of building the page in memory
+    with open(podcast_dir / 'index.html', 'w', encoding='utf-8', buffering=65536) as f:
+        f.write(_PODCASTS_INDEX_HEAD)
+        f.writelines(_EPISODE_CARD_TPL.format_map(podcast) for podcast in podcasts)
+        f.write(_PODCASTS_INDEX_TAIL)
     print(f"✅ Podcasts index created")
 
 
-def create_blog_index(topics: List[Dict], output_dir: Path):
-    print("📄 Creating /blog index...")
-    blog_dir = output_dir / 'web' / 'blog'
-    html = f'''<!DOCTYPE html>
+_BLOG_INDEX_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>Gift Guide Blog | SayPlay</title>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="stylesheet" href="/assets/styles.css">
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; }}
-        .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 25px; padding: 50px; }}
-        .logo {{ font-size: 56px; font-weight: 800; color: #667eea; text-align: center; margin-bottom: 15px; }}
-        .logo span {{ color: #FFD700; }}
-        h1 {{ text-align: center; color: #2d3748; font-size: 42px; margin-bottom: 60px; font-weight: 900; }}
-        .articles-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(380px, 1fr)); gap: 30px; }}
-        .article-card {{ background: #f7fafc; border-radius: 20px; overflow: hidden; border: 2px solid #e0e0e0; text-decoration: none; display: block; transition: all 0.3s; }}
-        .article-card:hover {{ border-color: #667eea; transform: translateY(-8px); }}
-        .article-header {{ background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 30px; }}
-        .article-card h3 {{ color: white; font-size: 24px; font-weight: 800; }}
-        .article-body {{ padding: 30px; }}
-        .back-link {{ display: inline-flex; align-items: center; gap: 10px; color: #667eea; text-decoration: none; font-weight: 600; margin-bottom: 30px; }}
-        @media (max-width: 768px) {{ .articles-grid {{ grid-template-columns: 1fr; }} }}
+        .container { max-width: 1400px; margin: 0 auto; background: white; border-radius: 25px; padding: 50px; }
+        h1 { text-align: center; color: #2d3748; font-size: 42px; margin-bottom: 60px; font-weight: 900; }
+        .articles-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(380px, 1fr)); gap: 30px; }
+        .article-card { background: #f7fafc; border-radius: 20px; overflow: hidden; border: 2px solid #e0e0e0; text-decoration: none; display: block; transition: all 0.3s; }
+        .article-card:hover { border-color: #667eea; transform: translateY(-8px); }
+        .article-header { background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 30px; }
+        .article-card h3 { color: white; font-size: 24px; font-weight: 800; }
+        .article-body { padding: 30px; }
+        @media (max-width: 768px) { .articles-grid { grid-template-columns: 1fr; } }
     </style>
 </head>
 <body>
@@ -924,47 +1488,53 @@ def create_blog_index(topics: List[Dict], output_dir: Path):
         <div class="logo">Say<span>Play</span></div>
         <h1><i class="fas fa-newspaper"></i> Gift Guide Blog</h1>
         <div class="articles-grid">'''
-    for i, topic in enumerate(topics, 1):
-        slug = topic['title'].lower().replace(' ', '-').replace("'", '')[:60]
-        html += f'''
+
+_BLOG_CARD_TPL = '''
             <a href="/blog/{slug}.html" class="article-card">
                 <div class="article-header">
-                    <h3>Episode {i}: {topic['title']}</h3>
+                    <h3>Episode {i}: {title}</h3>
                 </div>
                 <div class="article-body">
-                    <p style="color: #718096;"><i class="fas fa-tag"></i> {topic['category']}</p>
-                    <p style="color: #4a5568; margin: 15px 0;">Expert tips for choosing meaningful {topic['keyword']}.</p>
+                    <p style="color: #718096;"><i class="fas fa-tag"></i> {category}</p>
+                    <p style="color: #4a5568; margin: 15px 0;">Expert tips for choosing meaningful {keyword}.</p>
                     <span style="color: #667eea; font-weight: 700;">Read Article <i class="fas fa-arrow-right"></i></span>
                 </div>
             </a>'''
-    html += '</div></div></body></html>'
-    with open(blog_dir / 'index.html', 'w') as f:
-        f.write(html)
+
+_BLOG_INDEX_TAIL = '</div></div></body></html>'
+
+
+def create_blog_index(topics: List[Dict], output_dir: Path):
+    print("📄 Creating /blog index...")
+    blog_dir = output_dir / 'web' / 'blog'
+    # Stream fragments into a 64 KiB buffer instead of building the page in memory
+    with open(blog_dir / 'index.html', 'w', encoding='utf-8', buffering=65536) as f:
+        f.write(_BLOG_INDEX_HEAD)
+        f.writelines(
+            _BLOG_CARD_TPL.format(
+                i=i,
+                slug=topic['slug'],
+                title=topic['title'],
+                category=topic['category'],
+                keyword=topic['keyword']
+            )
+            for i, topic in enumerate(topics, 1)
+        )
+        f.write(_BLOG_INDEX_TAIL)
     print(f"✅ Blog index created")
 
 
-def create_seo_index(seo_pages: List[Dict], output_dir: Path):
-    print("📄 Creating /seo index...")
-    seo_dir = output_dir / 'web' / 'seo'
-    cities = {}
-    for page in seo_pages:
-        city = page['city']
-        if city not in cities:
-            cities[city] = []
-        cities[city].append(page)
-    html = f'''<!DOCTYPE html>
+_SEO_INDEX_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Gift Guides by Location | SayPlay</title>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="stylesheet" href="/assets/styles.css">
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; min-height: 100vh; }}
+        body {{ min-height: 100vh; }}
         .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 25px; padding: 50px; box-shadow: 0 25px 70px rgba(0,0,0,0.3); }}
-        .logo {{ font-size: 56px; font-weight: 800; color: #667eea; text-align: center; margin-bottom: 15px; }}
-        .logo span {{ color: #FFD700; }}
         h1 {{ text-align: center; color: #2d3748; font-size: 42px; margin-bottom: 15px; font-weight: 900; }}
         .subtitle {{ text-align: center; color: #718096; font-size: 20px; margin-bottom: 60px; }}
         .stats {{ display: flex; justify-content: center; gap: 40px; margin-bottom: 60px; flex-wrap: wrap; }}
@@ -978,7 +1548,6 @@ def create_seo_index(seo_pages: List[Dict], output_dir: Path):
         .link-card:hover {{ border-color: #667eea; transform: translateY(-5px); box-shadow: 0 10px 25px rgba(102, 126, 234, 0.15); }}
         .link-card h3 {{ color: #2d3748; font-size: 20px; margin-bottom: 8px; font-weight: 700; }}
         .link-card p {{ color: #718096; font-size: 15px; margin: 0; }}
-        .back-link {{ display: inline-flex; align-items: center; gap: 10px; color: #667eea; text-decoration: none; font-weight: 600; margin-bottom: 30px; }}
         @media (max-width: 768px) {{ .container {{ padding: 30px 20px; }} .links-grid {{ grid-template-columns: 1fr; }} }}
     </style>
 </head>
@@ -989,49 +1558,59 @@ def create_seo_index(seo_pages: List[Dict], output_dir: Path):
         <h1><i class="fas fa-map-marker-alt"></i> Gift Guides by Location</h1>
         <p class="subtitle">AI-generated pages with 5 unique design styles</p>
         <div class="stats">
-            <div class="stat"><div class="stat-number">{len(cities)}</div><div class="stat-label">UK Cities</div></div>
-            <div class="stat"><div class="stat-number">{len(seo_pages)}</div><div class="stat-label">Gift Guides</div></div>
+            <div class="stat"><div class="stat-number">{city_count}</div><div class="stat-label">UK Cities</div></div>
+            <div class="stat"><div class="stat-number">{page_count}</div><div class="stat-label">Gift Guides</div></div>
             <div class="stat"><div class="stat-number">5</div><div class="stat-label">Design Styles</div></div>
         </div>'''
-    for city in sorted(cities.keys()):
-        html += f'''
+
+_SEO_CITY_OPEN = '''
         <div class="city-section">
             <h2 class="city-title"><i class="fas fa-map-pin"></i> {city}</h2>
             <div class="links-grid">'''
-        for page in sorted(cities[city], key=lambda x: x['title']):
-            html += f'''
-                <a href="{page['url']}" class="link-card">
-                    <h3><i class="fas fa-gift"></i> {page['title']}</h3>
-                    <p>Style: {page['design']}</p>
+
+_SEO_CARD_TPL = '''
+                <a href="{url}" class="link-card">
+                    <h3><i class="fas fa-gift"></i> {title}</h3>
+                    <p>Style: {design}</p>
                 </a>'''
-        html += '''
+
+_SEO_CITY_CLOSE = '''
             </div>
         </div>'''
-    html += '''
+
+_SEO_INDEX_TAIL = '''
     </div>
 </body>
 </html>'''
-    with open(seo_dir / 'index.html', 'w', encoding='utf-8') as f:
-        f.write(html)
+
+
+def create_seo_index(seo_pages: List[Dict], output_dir: Path):
+    print("📄 Creating /seo index...")
+    seo_dir = output_dir / 'web' / 'seo'
+    # One sort by (city, title), then a single grouped pass
+    ordered = sorted(seo_pages, key=itemgetter('city', 'title'))
+    city_count = len({page['city'] for page in seo_pages})
+    # Stream fragments into a 64 KiB buffer instead of building the page in memory
+    with open(seo_dir / 'index.html', 'w', encoding='utf-8', buffering=65536) as f:
+        f.write(_SEO_INDEX_HEAD.format(city_count=city_count, page_count=len(seo_pages)))
+        for city, city_pages in groupby(ordered, key=itemgetter('city')):
+            f.write(_SEO_CITY_OPEN.format(city=city))
+            f.writelines(_SEO_CARD_TPL.format_map(page) for page in city_pages)
+            f.write(_SEO_CITY_CLOSE)
+        f.write(_SEO_INDEX_TAIL)
     print(f"✅ SEO index created")
 
 
-def create_complete_dashboard(topics: List[Dict], podcasts: List[Dict], seo_count: int, output_dir: Path, start_time):
-    print("📄 Creating complete dashboard...")
-    dashboard_dir = output_dir / 'web' / 'dashboard'
-    duration = (datetime.now() - start_time).total_seconds()
-    html = f'''<!DOCTYPE html>
+_DASHBOARD_TPL = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>SayPlay Dashboard</title>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    <link rel="stylesheet" href="/assets/styles.css">
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; }}
         .container {{ max-width: 1400px; margin: 0 auto; background: white; border-radius: 25px; padding: 50px; }}
-        .logo {{ font-size: 56px; font-weight: 800; color: #667eea; }}
-        .logo span {{ color: #FFD700; }}
+        .logo {{ text-align: left; margin-bottom: 0; }}
         .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 25px; margin: 50px 0; }}
         .stat {{ background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 35px; border-radius: 20px; text-align: center; }}
         .stat-number {{ font-size: 64px; font-weight: 900; margin: 15px 0; }}
@@ -1046,10 +1625,10 @@ def create_complete_dashboard(topics: List[Dict], podcasts: List[Dict], seo_coun
 <body>
     <div class="container">
         <div class="logo">Say<span>Play</span> Dashboard</div>
-        <p style="color: #666; margin-top: 10px;">{datetime.now().strftime("%B %d, %Y %H:%M UTC")}</p>
+        <p style="color: #666; margin-top: 10px;">{generated_at}</p>
         <div class="stats">
-            <div class="stat"><i class="fas fa-file-alt" style="font-size: 48px;"></i><div class="stat-number">{len(topics)}</div><div>Blog Articles</div></div>
-            <div class="stat"><i class="fas fa-microphone-alt" style="font-size: 48px;"></i><div class="stat-number">{len(podcasts)}</div><div>Podcasts</div></div>
+            <div class="stat"><i class="fas fa-file-alt" style="font-size: 48px;"></i><div class="stat-number">{topic_count}</div><div>Blog Articles</div></div>
+            <div class="stat"><i class="fas fa-microphone-alt" style="font-size: 48px;"></i><div class="stat-number">{podcast_count}</div><div>Podcasts</div></div>
             <div class="stat"><i class="fas fa-search-location" style="font-size: 48px;"></i><div class="stat-number">{seo_count}</div><div>SEO Pages</div></div>
             <div class="stat"><i class="fas fa-check-circle" style="font-size: 48px;"></i><div class="stat-number">✓</div><div>AI Generated</div></div>
         </div>
@@ -1058,12 +1637,12 @@ def create_complete_dashboard(topics: List[Dict], podcasts: List[Dict], seo_coun
             <a href="/blog" class="quick-link">
                 <i class="fas fa-newspaper"></i>
                 <h3>Blog Articles</h3>
-                <p style="color: #718096; margin: 0;">{len(topics)} expert guides</p>
+                <p style="color: #718096; margin: 0;">{topic_count} expert guides</p>
             </a>
             <a href="/podcasts" class="quick-link">
                 <i class="fas fa-podcast"></i>
                 <h3>Podcast Episodes</h3>
-                <p style="color: #718096; margin: 0;">{len(podcasts)} episodes with jingles</p>
+                <p style="color: #718096; margin: 0;">{podcast_count} episodes with jingles</p>
             </a>
             <a href="/seo" class="quick-link">
                 <i class="fas fa-map-marked-alt"></i>
@@ -1083,74 +1662,142 @@ def create_complete_dashboard(topics: List[Dict], podcasts: List[Dict], seo_coun
                 ✅ Podcasts 3-5 min with jingles<br>
                 ✅ SEO pages AI-generated (5 designs)<br>
                 ✅ RSS feed Apple Podcasts ready<br>
-                ⏱ Generation: {int(duration // 60)}m {int(duration % 60)}s
+                ⏱ Generation: {duration_min}m {duration_sec}s
             </p>
         </div>
     </div>
 </body>
 </html>'''
-    with open(dashboard_dir / 'index.html', 'w') as f:
-        f.write(html)
+
+
+def create_complete_dashboard(topics: List[Dict], podcasts: List[Dict], seo_count: int, output_dir: Path, start_mono: float):
+    print("📄 Creating complete dashboard...")
+    dashboard_dir = output_dir / 'web' / 'dashboard'
+    now = datetime.now()
+    duration = time.monotonic() - start_mono
+    with open(dashboard_dir / 'index.html', 'w', encoding='utf-8', buffering=65536) as f:
+        f.write(_DASHBOARD_TPL.format(
+            generated_at=now.strftime("%B %d, %Y %H:%M UTC"),
+            topic_count=len(topics),
+            podcast_count=len(podcasts),
+            seo_count=seo_count,
+            duration_min=int(duration // 60),
+            duration_sec=int(duration % 60)
+        ))
     print(f"✅ Complete dashboard created")
 
 
-async def main():
+async def main(force: bool = False):
     print("\n" + "="*70)
     print("TITAN V2 - AI WEBSITE BUILDER COMPLETE")
     print("="*70)
     start_time = datetime.now()
-    timestamp = datetime.now().strftime('%Y-%m-%d_%H%M')
+    # Elapsed time comes from the monotonic clock; wall-clock steps (NTP) can't make it negative
+    start_mono = time.monotonic()
+    timestamp = start_time.strftime('%Y-%m-%d_%H%M')
+    # One date for every page in the run
+    render_date = start_time.strftime('%B %d, %Y')
+    rss_pubdate = start_time.astimezone(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
     output_dir = Path(f'TITAN_OUTPUT_{timestamp}')
-    output_dir.mkdir(exist_ok=True)
     web_dir = output_dir / 'web'
-    for d in ['blog', 'dashboard', 'podcasts', 'seo']:
-        (web_dir / d).mkdir(parents=True, exist_ok=True)
+    # One parents=True call makes output_dir and web/; each subdirectory is then a single mkdir
+    web_dir.mkdir(parents=True, exist_ok=True)
+    for d in ['blog', 'dashboard', 'podcasts', 'seo', 'images', 'assets']:
+        (web_dir / d).mkdir(exist_ok=True)
+    # Resolved once; the per-topic writers only join a filename onto these
+    blog_dir = web_dir / 'blog'
+    podcast_dir = web_dir / 'podcasts'
     topic_gen = MultiTopicGenerator()
     topics = topic_gen.generate_daily_topics(count=10)
+    for topic in topics:
+        topic['slug'] = _slugify(topic['title'])
     validator = ContentUniqueValidator()
     gemini_key = os.getenv('GEMINI_API_KEY')
     image_gen = ProfessionalImageGenerator()
     podcast_gen = PodcastGeneratorWithJingles()
+    topic_cache = TopicCache()
+    await asyncio.to_thread(topic_cache.prune)
+    await asyncio.to_thread(image_gen.photo_cache.prune)
+    run_date = start_time.strftime('%Y-%m-%d')
     ai_builder = AIWebsiteBuilder(gemini_key)
     podcasts_list = []
-    for i, topic in enumerate(topics, 1):
+    # Topics are independent network-bound work; cap how many run at once for Gemini/TTS rate limits
+    topic_semaphore = asyncio.Semaphore(4)
+    # Hero files claimed so far (identical heroes share one content-hashed file)
+    hero_paths = set()
+    _write_page((blog_dir / 'article.css', _ARTICLE_CSS.encode('utf-8')))
+    _write_page((web_dir / 'assets' / 'styles.css', _INDEX_CSS.encode('utf-8')))
+    
+    async def process_topic(i: int, topic: dict) -> dict:
+        async with topic_semaphore:
+            print(f"\n{'='*70}")
+            print(f"TOPIC {i}/10: {topic['title']}")
+            print(f"{'='*70}")
+            cache_key = TopicCache.key(topic, i, run_date)
+            # --force regenerates everything; the fresh results still replace the cached ones
+            cached = None if force else await asyncio.to_thread(topic_cache.get, cache_key)
+            if cached:
+                print(f"\n  ♻️ Already generated today, reusing article {i}/{len(topics)}: {topic['title']}")
+                article, hero_image, podcast = cached
+            else:
+                print(f"\n  📝 Generating unique article {i}/{len(topics)}: {topic['title']}")
+                article = await generate_unique_article(topic, gemini_key, validator)
+                hero_image = await image_gen.generate_hero_image_async(topic['keyword'], article.get('seed'))
+                podcast = None
+            hero_path = f"images/hero-{hashlib.blake2b(hero_image, digest_size=12).hexdigest()}.jpg"
+            html = create_professional_html(article, topic, f'/{hero_path}', render_date)
+            if podcast is None and EDGE_TTS_AVAILABLE:
+                try:
+                    podcast = await podcast_gen.generate_podcast(article, topic, i)
+                    if not podcast or podcast['duration'] < 180:
+                        print(f"      ⚠️ Podcast too short")
+                        podcast = None
+                except Exception as e:
+                    print(f"      ⚠️ Podcast error: {str(e)[:60]}")
+            # Fallback articles are not worth keeping; the next run should try Gemini again
+            if article['seed'] != 'fallback' and (not cached or (podcast and not cached[2])):
+                await asyncio.to_thread(topic_cache.set, cache_key, article, hero_image, podcast)
+            writes = [(blog_dir / f"{topic['slug']}.html", html.encode('utf-8'))]
+            if hero_path not in hero_paths:
+                hero_paths.add(hero_path)
+                if not (web_dir / hero_path).exists():
+                    writes.append((web_dir / hero_path, hero_image))
+            filename = None
+            if podcast:
+                filename = f"episode-{i:02d}-{topic['slug'][:30]}.mp3"
+                writes.append((podcast_dir / filename, podcast['audio']))
+            # Worker threads write while the other topics are still waiting on the network
+            await asyncio.gather(*(asyncio.to_thread(_write_page, item) for item in writes))
+            print(f"  ✅ Complete")
+            return {'podcast': podcast, 'filename': filename}
+    
+    try:
+        results = await asyncio.gather(*(process_topic(i, topic) for i, topic in enumerate(topics, 1)))
+        for i, (topic, result) in enumerate(zip(topics, results), 1):
+            podcast = result['podcast']
+            if podcast:
+                duration_min, duration_sec = divmod(podcast['duration'], 60)
+                podcasts_list.append({'title': topic['title'], 'episode': i, 'filename': result['filename'], 'size': len(podcast['audio']), 'duration': podcast['duration'], 'duration_min': duration_min, 'duration_sec': duration_sec})
+        image_gen.generate_podcast_cover(web_dir / 'podcast-cover.jpg')
+        seo_pages = await generate_seo_pages_with_ai_builder(output_dir, validator, ai_builder, render_date)
         print(f"\n{'='*70}")
-        print(f"TOPIC {i}/10: {topic['title']}")
+        print("CREATING INDEX PAGES")
         print(f"{'='*70}")
-        print("  📝 Generating unique article...")
-        article = generate_unique_article(topic, gemini_key, validator)
-        hero_image = image_gen.generate_hero_image(topic['keyword'], article.get('seed'))
-        hero_base64 = base64.b64encode(hero_image).decode('utf-8')
-        slug = topic['title'].lower().replace(' ', '-').replace("'", '')[:60]
-        html = create_professional_html(article, topic, hero_base64)
-        with open(web_dir / 'blog' / f'{slug}.html', 'w') as f:
-            f.write(html)
-        if EDGE_TTS_AVAILABLE:
-            try:
-                podcast = await podcast_gen.generate_podcast(article, topic, i)
-                if podcast and podcast['duration'] >= 180:
-                    filename = f'episode-{i:02d}-{slug[:30]}.mp3'
-                    with open(web_dir / 'podcasts' / filename, 'wb') as f:
-                        f.write(podcast['audio'])
-                    podcasts_list.append({'title': topic['title'], 'episode': i, 'filename': filename, 'size': len(podcast['audio']), 'duration': podcast['duration']})
-                else:
-                    print(f"      ⚠️ Podcast too short")
-            except Exception as e:
-                print(f"      ⚠️ Podcast error: {str(e)[:60]}")
-        print(f"  ✅ Complete")
-    image_gen.generate_podcast_cover(web_dir / 'podcast-cover.jpg')
-    if podcasts_list:
-        cover_url = 'https://dashboard.sayplay.co.uk/podcast-cover.jpg'
-        create_rss_feed_apple(podcasts_list, web_dir / 'podcast.xml', cover_url)
-    seo_pages = generate_seo_pages_with_ai_builder(output_dir, validator, ai_builder)
-    print(f"\n{'='*70}")
-    print("CREATING INDEX PAGES")
-    print(f"{'='*70}")
-    create_podcasts_index(podcasts_list, output_dir)
-    create_blog_index(topics, output_dir)
-    create_seo_index(seo_pages, output_dir)
-    create_complete_dashboard(topics, podcasts_list, len(seo_pages), output_dir, start_time)
-    duration = (datetime.now() - start_time).total_seconds()
+        # Each writer renders its own file from read-only inputs, so they can run side by side
+        finalizers = [
+            asyncio.to_thread(create_podcasts_index, podcasts_list, output_dir),
+            asyncio.to_thread(create_blog_index, topics, output_dir),
+            asyncio.to_thread(create_seo_index, seo_pages, output_dir),
+            asyncio.to_thread(create_complete_dashboard, topics, podcasts_list, len(seo_pages), output_dir, start_mono),
+        ]
+        if podcasts_list:
+            cover_url = 'https://dashboard.sayplay.co.uk/podcast-cover.jpg'
+            finalizers.append(asyncio.to_thread(create_rss_feed_apple, podcasts_list, web_dir / 'podcast.xml', cover_url, rss_pubdate))
+        await asyncio.gather(*finalizers)
+    finally:
+        await image_gen.close()
+        ai_builder.close()
+    duration = time.monotonic() - start_mono
     print(f"\n{'='*70}")
     print("TITAN COMPLETE!")
     print(f"{'='*70}")
@@ -1163,4 +1810,8 @@ async def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[_StdoutBatchHandler(sys.stdout)])
+    parser = argparse.ArgumentParser(description="TITAN V2 - AI Website Builder")
+    parser.add_argument('--force', action='store_true', help="Regenerate every topic, ignoring today's .topic_cache entries")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(force=args.force)))
@@ -10,12 +10,15 @@ TITAN MASTER ORCHESTRATOR V2 - PROFESSIONAL COMPLETE
 import sys
 import os
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import json
-import base64
 import asyncio
 from typing import List, Dict
 import hashlib
+import re
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -42,6 +45,42 @@ except ImportError:
     EDGE_TTS_AVAILABLE = False
     print("⚠️ edge-tts not installed")
 
+# RSS
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    from xml.etree import ElementTree as etree
+    LXML_AVAILABLE = False
+
+ITUNES_NS = 'http://www.itunes.com/dtds/podcast-1.0.dtd'
+ITUNES = '{' + ITUNES_NS + '}'
+
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+_SLUG_TABLE = str.maketrans({' ': '-', "'": '', ':': '', '"': '', ',': '', '.': ''})
+
+
+def _slugify(title: str) -> str:
+    """URL slug for an article title, in a single translate pass"""
+    return title.lower().translate(_SLUG_TABLE)[:60]
+
+
+@lru_cache(maxsize=16)
+def _load_font(size: int):
+    """Load the logo font once per size"""
+    try:
+        return ImageFont.truetype(FONT_BOLD, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def _text_width(text: str, size: int) -> int:
+    """Rendered width of text in the logo font"""
+    bbox = _load_font(size).getbbox(text)
+    return bbox[2] - bbox[0]
+
 
 class ProfessionalImageGenerator:
     """Generate professional images with SayPlay branding"""
@@ -50,27 +89,40 @@ class ProfessionalImageGenerator:
         self.unsplash_key = os.getenv('UNSPLASH_ACCESS_KEY', '')
         self.pexels_key = os.getenv('PEXELS_API_KEY', '')
     
-    def generate_hero_image(self, keyword: str, width: int = 1200, height: int = 630) -> bytes:
-        """Generate hero image with logo"""
+    async def fetch_hero_photo(self, keyword: str, width: int = 1200, height: int = 630):
+        """Race Unsplash and Pexels; return the first photo's bytes, or None for the gradient fallback"""
         print(f"      🖼 Fetching image for: {keyword}")
         
-        # Try Unsplash
+        sources = []
         if self.unsplash_key:
-            img = self._fetch_unsplash(keyword, width, height)
-            if img:
-                print(f"         ✅ Got Unsplash image")
-                return self._add_logo_overlay(img)
-        
-        # Try Pexels
+            sources.append(('Unsplash', self._fetch_unsplash))
         if self.pexels_key:
-            img = self._fetch_pexels(keyword, width, height)
-            if img:
-                print(f"         ✅ Got Pexels image")
-                return self._add_logo_overlay(img)
+            sources.append(('Pexels', self._fetch_pexels))
+        
+        tasks = [
+            asyncio.create_task(self._fetch_source(name, fetch, keyword, width, height))
+            for name, fetch in sources
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, photo = await next_done
+                if photo:
+                    print(f"         ✅ Got {name} image")
+                    return photo
+        finally:
+            # The losing request is abandoned; its worker thread finishes on its own
+            for task in tasks:
+                task.cancel()
         
         # Fallback gradient
         print(f"         ⚠️ Using gradient fallback")
-        return self._generate_gradient(width, height)
+        return None
+    
+    @staticmethod
+    async def _fetch_source(name: str, fetch, keyword: str, width: int, height: int):
+        """Run a blocking fetcher in a worker thread, tagging the result with its source"""
+        return name, await asyncio.to_thread(fetch, keyword, width, height)
     
     def _fetch_unsplash(self, query: str, width: int, height: int):
         """Fetch from Unsplash API"""
@@ -90,7 +142,7 @@ class ProfessionalImageGenerator:
                 
                 img_response = requests.get(image_url, timeout=25)
                 if img_response.status_code == 200:
-                    return Image.open(BytesIO(img_response.content)).convert('RGB')
+                    return img_response.content
         except Exception as e:
             print(f"         Unsplash error: {str(e)[:80]}")
         
@@ -112,18 +164,19 @@ class ProfessionalImageGenerator:
             if response.status_code == 200:
                 data = response.json()
                 if data.get('photos'):
-                    image_url = data['photos'][0]['src']['large2x']
-                    
+                    # Let the Pexels CDN crop to the hero size
+                    image_url = data['photos'][0]['src']['original'] + f"?auto=compress&cs=tinysrgb&fit=crop&w={width}&h={height}"
+
                     img_response = requests.get(image_url, timeout=25)
                     if img_response.status_code == 200:
-                        img = Image.open(BytesIO(img_response.content)).convert('RGB')
-                        return img.resize((width, height), Image.Resampling.LANCZOS)
+                        return img_response.content
         except Exception as e:
             print(f"         Pexels error: {str(e)[:80]}")
         
         return None
     
-    def _generate_gradient(self, width: int, height: int) -> bytes:
+    @staticmethod
+    def _generate_gradient(width: int, height: int) -> bytes:
         """Generate gradient background"""
         img = Image.new('RGB', (width, height))
         draw = ImageDraw.Draw(img)
@@ -134,9 +187,10 @@ class ProfessionalImageGenerator:
             b = int(234 + (162 - 234) * y / height)
             draw.line([(0, y), (width, y)], fill=(r, g, b))
         
-        return self._add_logo_overlay(img)
+        return ProfessionalImageGenerator._add_logo_overlay(img)
     
-    def _add_logo_overlay(self, img: Image.Image) -> bytes:
+    @staticmethod
+    def _add_logo_overlay(img: Image.Image) -> bytes:
         """Add SayPlay logo to image"""
         width, height = img.size
         
@@ -157,12 +211,8 @@ class ProfessionalImageGenerator:
         # Add logo text
         draw = ImageDraw.Draw(img)
         
-        try:
-            logo_size = max(40, int(height * 0.08))
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", logo_size)
-        except:
-            logo_size = 40
-            font = ImageFont.load_default()
+        logo_size = max(40, int(height * 0.08))
+        font = _load_font(logo_size)
         
         # Position logo
         logo_x = width - int(width * 0.35)
@@ -172,8 +222,7 @@ class ProfessionalImageGenerator:
         draw.text((logo_x, logo_y), "Say", fill=(255, 255, 255), font=font)
         
         # Calculate "Say" width
-        say_bbox = draw.textbbox((0, 0), "Say", font=font)
-        say_width = say_bbox[2] - say_bbox[0]
+        say_width = _text_width("Say", logo_size)
         
         # Draw "Play" in gold
         draw.text((logo_x + say_width, logo_y), "Play", fill=(255, 215, 0), font=font)
@@ -181,15 +230,29 @@ class ProfessionalImageGenerator:
         # Convert to bytes
         img = img.convert('RGB')
         output = BytesIO()
-        img.save(output, format='JPEG', quality=92)
+        img.save(output, format='JPEG', quality=85, optimize=True, progressive=True, subsampling=2)
         return output.getvalue()
 
 
+def _brand_image_bytes(photo, width: int, height: int) -> bytes:
+    """Decode a fetched photo (or draw the gradient fallback) and add the logo"""
+    if photo:
+        try:
+            img = Image.open(BytesIO(photo)).convert('RGB')
+            if img.size != (width, height):
+                img = img.resize((width, height), Image.Resampling.LANCZOS)
+            return ProfessionalImageGenerator._add_logo_overlay(img)
+        except Exception as e:
+            print(f"         Image decode error: {str(e)[:80]}")
+    
+    return ProfessionalImageGenerator._generate_gradient(width, height)
+
+
 class LongFormPodcastGenerator:
     """Generate 3-5 minute podcasts"""
     
-    async def generate_podcast(self, article: dict, topic: dict, episode_num: int) -> dict:
-        """Generate long-form podcast"""
+    async def generate_podcast(self, article: dict, topic: dict, episode_num: int, output_path: Path) -> dict:
+        """Generate long-form podcast, streaming the MP3 to output_path"""
         if not EDGE_TTS_AVAILABLE:
             print("      ⚠️ Edge TTS not available")
             return None
@@ -240,29 +303,49 @@ class LongFormPodcastGenerator:
         voice = "en-GB-SoniaNeural"
         communicate = edge_tts.Communicate(full_script, voice, rate="+0%", volume="+0%")
         
-        # Save to temp file
-        temp_file = f"temp_podcast_{episode_num}.mp3"
-        await communicate.save(temp_file)
-        
-        # Read audio data
-        with open(temp_file, 'rb') as f:
-            audio_data = f.read()
-        
-        # Cleanup
-        os.remove(temp_file)
+        # Write audio chunks to the final file as they arrive
+        size = 0
+        try:
+            with open(output_path, 'wb') as f:
+                async for chunk in communicate.stream():
+                    if chunk['type'] == 'audio':
+                        f.write(chunk['data'])
+                        size += len(chunk['data'])
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            raise
         
-        duration = len(audio_data) / 3000  # Rough estimate
+        duration = size / 3000  # Rough estimate
         
         print(f"         ✅ Podcast generated (~{int(duration)}s)")
         
         return {
-            'audio': audio_data,
+            'size': size,
             'script': full_script,
             'duration': int(duration),
             'voice': voice
         }
 
 
+_HEADER_RE = re.compile(r'^[^\S\n]*(#+)[^\S\n]*(.*)$', re.M)
+
+
+def _parse_sections(text: str) -> list:
+    """Split markdown into {'title', 'content'} sections at # headers"""
+    # re.split yields [body, hashes, title, body, hashes, title, body, ...]
+    parts = _HEADER_RE.split(text)
+    titles = [''] + [title.strip() for title in parts[2::3]]
+    bodies = parts[0::3]
+    
+    sections = []
+    for title, body in zip(titles, bodies):
+        content = ''.join(line.strip() + '\n' for line in body.splitlines() if line.strip())
+        if content:
+            sections.append({'title': title, 'content': content})
+    
+    return sections
+
+
 def generate_article_with_gemini(topic: dict, api_key: str) -> dict:
     """Generate unique article with Gemini"""
     
@@ -310,28 +393,7 @@ IMPORTANT:
         response = model.generate_content(prompt)
         article_text = response.text
         
-        # Parse sections
-        sections = []
-        current_section = {'title': '', 'content': ''}
-        
-        for line in article_text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            if line.startswith('##'):
-                if current_section['content']:
-                    sections.append(current_section)
-                current_section = {'title': line.replace('##', '').strip(), 'content': ''}
-            elif line.startswith('#'):
-                if current_section['content']:
-                    sections.append(current_section)
-                current_section = {'title': line.replace('#', '').strip(), 'content': ''}
-            else:
-                current_section['content'] += line + '\n'
-        
-        if current_section['content']:
-            sections.append(current_section)
+        sections = _parse_sections(article_text)
         
         word_count = len(article_text.split())
         
@@ -398,17 +460,15 @@ Remember, it's not about how much you spend, but about the thought behind the gi
     }
 
 
-def create_professional_html(article: dict, topic: dict, hero_base64: str, slug: str) -> str:
-    """Create professional HTML with hero image"""
-    
-    html = f'''<!DOCTYPE html>
+# Article page chrome; the section markup is rendered between head and tail
+_HTML_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="{article['text'][:160]}...">
-    <meta name="keywords" content="{topic['keyword']}, personalized gifts, sayplay, voice messages">
-    <title>{article['title']} | SayPlay Gift Guide</title>
+    <meta name="description" content="{description}...">
+    <meta name="keywords" content="{keyword}, personalized gifts, sayplay, voice messages">
+    <title>{title} | SayPlay Gift Guide</title>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
     <style>
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
@@ -423,7 +483,7 @@ def create_professional_html(article: dict, topic: dict, hero_base64: str, slug:
         .hero {{
             position: relative;
             height: 600px;
-            background: url('data:image/jpeg;base64,{hero_base64}') center/cover no-repeat;
+            background: url('hero-{slug}.jpg') center/cover no-repeat;
             display: flex;
             align-items: center;
             justify-content: center;
@@ -653,19 +713,19 @@ def create_professional_html(article: dict, topic: dict, hero_base64: str, slug:
         <div class="hero-overlay"></div>
         <div class="hero-content">
             <div class="logo">Say<span>Play</span></div>
-            <h1>{article['title']}</h1>
+            <h1>{title}</h1>
             <div class="meta">
                 <span class="meta-item">
                     <i class="far fa-calendar-alt"></i>
-                    {datetime.now().strftime("%B %d, %Y")}
+                    {date}
                 </span>
                 <span class="meta-item">
                     <i class="far fa-clock"></i>
-                    {max(1, article['word_count'] // 200)} min read
+                    {read_minutes} min read
                 </span>
                 <span class="meta-item">
                     <i class="fas fa-tags"></i>
-                    {topic['category']}
+                    {category}
                 </span>
             </div>
         </div>
@@ -679,25 +739,8 @@ def create_professional_html(article: dict, topic: dict, hero_base64: str, slug:
         
         <div class="content">
 '''
-    
-    # Add article sections
-    for section in article['sections']:
-        if section['title']:
-            html += f"<h2>{section['title']}</h2>\n"
-        
-        paragraphs = section['content'].strip().split('\n')
-        for para in paragraphs:
-            para = para.strip()
-            if para:
-                # Check if it's a bullet point
-                if para.startswith('**') and para.endswith('**'):
-                    html += f"<h3>{para.replace('**', '')}</h3>\n"
-                elif para.startswith('-') or para.startswith('*'):
-                    html += f"<p><strong>•</strong> {para[1:].strip()}</p>\n"
-                else:
-                    html += f"<p>{para}</p>\n"
-    
-    html += f'''
+
+_HTML_TAIL = '''
             <div class="cta-section">
                 <div class="cta-icon">
                     <i class="fas fa-gift"></i>
@@ -731,52 +774,50 @@ def create_professional_html(article: dict, topic: dict, hero_base64: str, slug:
     </div>
 </body>
 </html>'''
-    
-    return html
 
 
-def generate_seo_pages(output_dir: Path) -> List[Dict]:
-    """Generate 100 SEO landing pages with FULL content"""
-    
-    print(f"\n{'='*70}")
-    print("GENERATING SEO LANDING PAGES")
-    print(f"{'='*70}")
-    
-    seo_dir = output_dir / 'web' / 'seo'
-    seo_dir.mkdir(parents=True, exist_ok=True)
-    
-    # UK Cities
-    cities = [
-        'London', 'Manchester', 'Birmingham', 'Liverpool', 'Leeds',
-        'Glasgow', 'Edinburgh', 'Bristol', 'Cardiff', 'Sheffield',
-        'Newcastle', 'Belfast', 'Brighton', 'Oxford', 'Cambridge',
-        'York', 'Bath', 'Nottingham', 'Leicester', 'Southampton'
-    ]
-    
-    # Gift types
-    gift_types = [
-        {'slug': 'birthday-gifts', 'title': 'Birthday Gifts', 'emoji': '🎂'},
-        {'slug': 'anniversary-gifts', 'title': 'Anniversary Gifts', 'emoji': '💑'},
-        {'slug': 'wedding-gifts', 'title': 'Wedding Gifts', 'emoji': '💍'},
-        {'slug': 'christmas-gifts', 'title': 'Christmas Gifts', 'emoji': '🎄'},
-        {'slug': 'mothers-day-gifts', 'title': "Mother's Day Gifts", 'emoji': '🌸'}
-    ]
+def create_professional_html(article: dict, topic: dict, slug: str, date: str) -> str:
+    """Create professional HTML referencing the hero-{slug}.jpg image"""
+    
+    parts = [_HTML_HEAD.format(
+        description=escape(article['text'][:160]),
+        keyword=topic['keyword'],
+        title=article['title'],
+        slug=slug,
+        date=date,
+        read_minutes=max(1, article['word_count'] // 200),
+        category=topic['category']
+    )]
+    
+    # Add article sections (lines are already stripped by the parser)
+    for section in article['sections']:
+        if section['title']:
+            parts.append(f"<h2>{section['title']}</h2>\n")
+        
+        for para in section['content'].split('\n'):
+            if para:
+                # Check if it's a bullet point
+                if para.startswith('**') and para.endswith('**'):
+                    parts.append(f"<h3>{para.replace('**', '')}</h3>\n")
+                elif para.startswith('-') or para.startswith('*'):
+                    parts.append(f"<p><strong>•</strong> {para[1:].strip()}</p>\n")
+                else:
+                    parts.append(f"<p>{para}</p>\n")
     
-    pages = []
+    parts.append(_HTML_TAIL)
     
-    for city in cities:
-        for gift_type in gift_types:
-            slug = f"{gift_type['slug']}-{city.lower().replace(' ', '-')}"
-            
-            # Create FULL content page
-            html = f'''<!DOCTYPE html>
+    return ''.join(parts)
+
+
+# Full SEO landing page, filled per city/gift type with str.format_map
+SEO_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{gift_type['title']} in {city} | SayPlay Gift Guide</title>
-    <meta name="description" content="Find perfect {gift_type['title'].lower()} in {city}. Personalized voice message gifts that create lasting memories. Browse unique gift ideas with SayPlay.">
-    <meta name="keywords" content="{gift_type['slug']}, {city}, personalized gifts, voice messages, sayplay">
+    <title>{gift_title} in {city} | SayPlay Gift Guide</title>
+    <meta name="description" content="Find perfect {gift_title_lower} in {city}. Personalized voice message gifts that create lasting memories. Browse unique gift ideas with SayPlay.">
+    <meta name="keywords" content="{gift_slug}, {city}, personalized gifts, voice messages, sayplay">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
     <style>
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
@@ -917,7 +958,7 @@ def generate_seo_pages(output_dir: Path) -> List[Dict]:
 <body>
     <div class="hero">
         <div class="logo">Say<span>Play</span></div>
-        <h1>{gift_type['emoji']} {gift_type['title']} in {city}</h1>
+        <h1>{gift_emoji} {gift_title} in {city}</h1>
         <p>Personalized Gifts with Voice Messages</p>
     </div>
     
@@ -927,9 +968,9 @@ def generate_seo_pages(output_dir: Path) -> List[Dict]:
             Back to all locations
         </a>
         
-        <h2>Find Perfect {gift_type['title']} in {city}</h2>
+        <h2>Find Perfect {gift_title} in {city}</h2>
         
-        <p>Looking for unique {gift_type['title'].lower()} in {city}? You're in the right place. Whether you're shopping in the city center or browsing online, finding a gift that truly resonates can transform a special occasion into an unforgettable memory.</p>
+        <p>Looking for unique {gift_title_lower} in {city}? You're in the right place. Whether you're shopping in the city center or browsing online, finding a gift that truly resonates can transform a special occasion into an unforgettable memory.</p>
         
         <p>At SayPlay, we believe the best gifts combine thoughtfulness with personalization. That's why we've created a way to add your voice to any gift, making it truly one-of-a-kind.</p>
         
@@ -1004,7 +1045,7 @@ def generate_seo_pages(output_dir: Path) -> List[Dict]:
         
         <p><strong>Your Voice, Forever:</strong> Messages never expire. They can hear your voice whenever they want.</p>
         
-        <p><strong>Perfect for Any Occasion:</strong> {gift_type['title']}, anniversaries, celebrations, or "just because" moments.</p>
+        <p><strong>Perfect for Any Occasion:</strong> {gift_title}, anniversaries, celebrations, or "just because" moments.</p>
         
         <p><strong>Privacy Protected:</strong> Your message is secure and can only be accessed by tapping the NFC sticker.</p>
         
@@ -1012,19 +1053,79 @@ def generate_seo_pages(output_dir: Path) -> List[Dict]:
     </div>
 </body>
 </html>'''
+
+
+def _write_page(item):
+    """Write one pre-encoded page in a single buffered call"""
+    path, data = item
+    with open(path, 'wb', buffering=65536) as f:
+        f.write(data)
+
+
+def generate_seo_pages(output_dir: Path) -> List[Dict]:
+    """Generate 100 SEO landing pages with FULL content"""
+    
+    print(f"\n{'='*70}")
+    print("GENERATING SEO LANDING PAGES")
+    print(f"{'='*70}")
+    
+    seo_dir = output_dir / 'web' / 'seo'
+    seo_dir.mkdir(parents=True, exist_ok=True)
+    
+    # UK Cities
+    cities = [
+        'London', 'Manchester', 'Birmingham', 'Liverpool', 'Leeds',
+        'Glasgow', 'Edinburgh', 'Bristol', 'Cardiff', 'Sheffield',
+        'Newcastle', 'Belfast', 'Brighton', 'Oxford', 'Cambridge',
+        'York', 'Bath', 'Nottingham', 'Leicester', 'Southampton'
+    ]
+    
+    # Gift types
+    gift_types = [
+        {'slug': 'birthday-gifts', 'title': 'Birthday Gifts', 'emoji': '🎂'},
+        {'slug': 'anniversary-gifts', 'title': 'Anniversary Gifts', 'emoji': '💑'},
+        {'slug': 'wedding-gifts', 'title': 'Wedding Gifts', 'emoji': '💍'},
+        {'slug': 'christmas-gifts', 'title': 'Christmas Gifts', 'emoji': '🎄'},
+        {'slug': 'mothers-day-gifts', 'title': "Mother's Day Gifts", 'emoji': '🌸'}
+    ]
+    
+    # Per-gift-type fields are the same for every city
+    gift_meta = [
+        (gift_type, gift_type['title'], gift_type['title'].lower())
+        for gift_type in gift_types
+    ]
+    
+    pages = []
+    rendered = []
+    
+    for city in cities:
+        city_slug = city.lower().replace(' ', '-')
+        
+        for gift_type, gift_title, gift_title_lower in gift_meta:
+            slug = f"{gift_type['slug']}-{city_slug}"
             
-            # Save page
-            with open(seo_dir / f'{slug}.html', 'w', encoding='utf-8') as f:
-                f.write(html)
+            # Create FULL content page
+            html = SEO_TEMPLATE.format_map({
+                'city': city,
+                'gift_title': gift_title,
+                'gift_title_lower': gift_title_lower,
+                'gift_slug': gift_type['slug'],
+                'gift_emoji': gift_type['emoji']
+            })
+            rendered.append((seo_dir / f'{slug}.html', html.encode('utf-8')))
             
             pages.append({
                 'slug': slug,
-                'title': f"{gift_type['title']} in {city}",
+                'title': f"{gift_title} in {city}",
                 'city': city,
-                'category': gift_type['title'],
+                'category': gift_title,
                 'url': f"/seo/{slug}.html"
             })
     
+    # Save pages
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(_write_page, rendered))
+    
     print(f"✅ Generated {len(pages)} SEO pages with full content")
     
     return pages
@@ -1209,14 +1310,7 @@ def create_seo_index(pages: List[Dict], output_dir: Path):
     print(f"✅ SEO index created at /seo")
 
 
-def create_blog_index(topics: List[Dict], output_dir: Path):
-    """Create index page for all blog articles"""
-    
-    print("📄 Creating blog index page...")
-    
-    blog_dir = output_dir / 'web' / 'blog'
-    
-    html = f'''<!DOCTYPE html>
+_BLOG_INDEX_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1224,48 +1318,48 @@ def create_blog_index(topics: List[Dict], output_dir: Path):
     <title>Gift Guide Blog | SayPlay</title>
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
             min-height: 100vh;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 25px;
             padding: 50px;
             box-shadow: 0 25px 70px rgba(0,0,0,0.3);
-        }}
-        .logo {{
+        }
+        .logo {
             font-size: 56px;
             font-weight: 800;
             color: #667eea;
             text-align: center;
             margin-bottom: 15px;
-        }}
-        .logo span {{ color: #FFD700; }}
-        h1 {{
+        }
+        .logo span { color: #FFD700; }
+        h1 {
             text-align: center;
             color: #2d3748;
             font-size: 42px;
             margin-bottom: 15px;
             font-weight: 900;
-        }}
-        .subtitle {{
+        }
+        .subtitle {
             text-align: center;
             color: #718096;
             font-size: 20px;
             margin-bottom: 60px;
-        }}
-        .articles-grid {{
+        }
+        .articles-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(380px, 1fr));
             gap: 30px;
-        }}
-        .article-card {{
+        }
+        .article-card {
             background: #f7fafc;
             border-radius: 20px;
             overflow: hidden;
@@ -1273,19 +1367,19 @@ def create_blog_index(topics: List[Dict], output_dir: Path):
             transition: all 0.3s;
             text-decoration: none;
             display: block;
-        }}
-        .article-card:hover {{
+        }
+        .article-card:hover {
             border-color: #667eea;
             transform: translateY(-8px);
             box-shadow: 0 15px 35px rgba(102, 126, 234, 0.2);
-        }}
-        .article-header {{
+        }
+        .article-header {
             background: linear-gradient(135deg, #667eea, #764ba2);
             color: white;
             padding: 30px;
             position: relative;
-        }}
-        .episode-badge {{
+        }
+        .episode-badge {
             position: absolute;
             top: 15px;
             right: 15px;
@@ -1294,47 +1388,47 @@ def create_blog_index(topics: List[Dict], output_dir: Path):
             border-radius: 20px;
             font-size: 14px;
             font-weight: 700;
-        }}
-        .article-card h3 {{
+        }
+        .article-card h3 {
             color: white;
             font-size: 24px;
             margin: 0;
             font-weight: 800;
             line-height: 1.3;
-        }}
-        .article-body {{
+        }
+        .article-body {
             padding: 30px;
-        }}
-        .article-meta {{
+        }
+        .article-meta {
             display: flex;
             gap: 20px;
             margin-bottom: 15px;
             font-size: 15px;
             color: #718096;
-        }}
-        .article-meta span {{
+        }
+        .article-meta span {
             display: flex;
             align-items: center;
             gap: 6px;
-        }}
-        .article-excerpt {{
+        }
+        .article-excerpt {
             color: #4a5568;
             font-size: 16px;
             line-height: 1.7;
             margin-bottom: 20px;
-        }}
-        .read-more {{
+        }
+        .read-more {
             display: inline-flex;
             align-items: center;
             gap: 8px;
             color: #667eea;
             font-weight: 700;
             font-size: 16px;
-        }}
-        @media (max-width: 768px) {{
-            .container {{ padding: 30px 20px; }}
-            .articles-grid {{ grid-template-columns: 1fr; }}
-        }}
+        }
+        @media (max-width: 768px) {
+            .container { padding: 30px 20px; }
+            .articles-grid { grid-template-columns: 1fr; }
+        }
     </style>
 </head>
 <body>
@@ -1344,21 +1438,16 @@ def create_blog_index(topics: List[Dict], output_dir: Path):
         <p class="subtitle">Expert tips and ideas for perfect personalized gifts</p>
         
         <div class="articles-grid">'''
-    
-    for i, topic in enumerate(topics, 1):
-        slug = topic['title'].lower().replace(' ', '-').replace("'", '').replace(':', '')[:60]
-        
-        excerpt = f"Discover the best {topic['keyword']} that create lasting memories. Learn how to choose meaningful gifts and add a personal touch."
-        
-        html += f'''
+
+_BLOG_CARD_TEMPLATE = '''
             <a href="/blog/{slug}.html" class="article-card">
                 <div class="article-header">
                     <div class="episode-badge">Episode {i}</div>
-                    <h3>{topic['title']}</h3>
+                    <h3>{title}</h3>
                 </div>
                 <div class="article-body">
                     <div class="article-meta">
-                        <span><i class="fas fa-tag"></i> {topic['category']}</span>
+                        <span><i class="fas fa-tag"></i> {category}</span>
                         <span><i class="far fa-clock"></i> 8 min read</span>
                     </div>
                     <p class="article-excerpt">{excerpt}</p>
@@ -1368,12 +1457,32 @@ def create_blog_index(topics: List[Dict], output_dir: Path):
                     </span>
                 </div>
             </a>'''
-    
-    html += '''
+
+_BLOG_INDEX_TAIL = '''
         </div>
     </div>
 </body>
 </html>'''
+
+
+def create_blog_index(topics: List[Dict], output_dir: Path):
+    """Create index page for all blog articles"""
+    
+    print("📄 Creating blog index page...")
+    
+    blog_dir = output_dir / 'web' / 'blog'
+    
+    cards = [
+        _BLOG_CARD_TEMPLATE.format(
+            i=i,
+            slug=topic.get('_slug') or _slugify(topic['title']),
+            title=topic['title'],
+            category=topic['category'],
+            excerpt=f"Discover the best {topic['keyword']} that create lasting memories. Learn how to choose meaningful gifts and add a personal touch."
+        )
+        for i, topic in enumerate(topics, 1)
+    ]
+    html = _BLOG_INDEX_HEAD + ''.join(cards) + _BLOG_INDEX_TAIL
     
     with open(blog_dir / 'index.html', 'w', encoding='utf-8') as f:
         f.write(html)
@@ -1389,35 +1498,44 @@ def create_rss_feed(podcasts: List[Dict], output_file: Path):
     
     print(f"\n📡 Generating RSS feed...")
     
-    from xml.etree.ElementTree import Element, SubElement, tostring
-    from xml.dom import minidom
+    # lxml takes the namespace map up front; ElementTree needs it registered
+    if LXML_AVAILABLE:
+        rss = etree.Element('rss', {'version': '2.0'}, nsmap={'itunes': ITUNES_NS})
+    else:
+        etree.register_namespace('itunes', ITUNES_NS)
+        rss = etree.Element('rss', {'version': '2.0'})
+    channel = etree.SubElement(rss, 'channel')
     
-    rss = Element('rss', {'version': '2.0', 'xmlns:itunes': 'http://www.itunes.com/dtds/podcast-1.0.dtd'})
-    channel = SubElement(rss, 'channel')
+    etree.SubElement(channel, 'title').text = 'SayPlay Gift Guide Podcast'
+    etree.SubElement(channel, 'description').text = 'Your daily guide to finding perfect personalized gifts with expert tips and ideas.'
+    etree.SubElement(channel, 'link').text = 'https://dashboard.sayplay.co.uk'
+    etree.SubElement(channel, 'language').text = 'en-GB'
+    etree.SubElement(channel, ITUNES + 'author').text = 'SayPlay - VoiceGift UK'
+    etree.SubElement(channel, ITUNES + 'summary').text = 'Expert gift-giving advice and inspiration'
     
-    SubElement(channel, 'title').text = 'SayPlay Gift Guide Podcast'
-    SubElement(channel, 'description').text = 'Your daily guide to finding perfect personalized gifts with expert tips and ideas.'
-    SubElement(channel, 'link').text = 'https://dashboard.sayplay.co.uk'
-    SubElement(channel, 'language').text = 'en-GB'
-    SubElement(channel, 'itunes:author').text = 'SayPlay - VoiceGift UK'
-    SubElement(channel, 'itunes:summary').text = 'Expert gift-giving advice and inspiration'
+    # Same timestamp for every episode in this run
+    pub_date = datetime.now(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT')
     
     for podcast in podcasts:
-        item = SubElement(channel, 'item')
-        SubElement(item, 'title').text = podcast['title']
-        SubElement(item, 'description').text = f"Episode {podcast['episode']}: {podcast['title']}"
-        SubElement(item, 'enclosure', {
+        item = etree.SubElement(channel, 'item')
+        etree.SubElement(item, 'title').text = podcast['title']
+        etree.SubElement(item, 'description').text = f"Episode {podcast['episode']}: {podcast['title']}"
+        etree.SubElement(item, 'enclosure', {
             'url': f"https://dashboard.sayplay.co.uk/podcasts/{podcast['filename']}",
             'length': str(podcast['size']),
             'type': 'audio/mpeg'
         })
-        SubElement(item, 'itunes:duration').text = str(podcast['duration'])
-        SubElement(item, 'pubDate').text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
+        etree.SubElement(item, ITUNES + 'duration').text = str(podcast['duration'])
+        etree.SubElement(item, 'pubDate').text = pub_date
     
-    xml_string = minidom.parseString(tostring(rss, 'utf-8')).toprettyxml(indent='  ')
+    # Serialize straight to indented bytes, no minidom reparse
+    if LXML_AVAILABLE:
+        xml_bytes = etree.tostring(rss, pretty_print=True, xml_declaration=True, encoding='utf-8')
+    else:
+        etree.indent(rss)
+        xml_bytes = etree.tostring(rss, encoding='utf-8', xml_declaration=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(xml_string)
+    output_file.write_bytes(xml_bytes)
     
     print(f"✅ RSS feed generated ({len(podcasts)} episodes)")
 
@@ -1429,7 +1547,9 @@ async def main():
     
     start_time = datetime.now()
     
-    timestamp = datetime.now().strftime('%Y-%m-%d_%H%M')
+    timestamp = start_time.strftime('%Y-%m-%d_%H%M')
+    article_date = start_time.strftime("%B %d, %Y")
+    dashboard_date = datetime.now(timezone.utc).strftime("%B %d, %Y %H:%M UTC")
     output_dir = Path(f'TITAN_OUTPUT_{timestamp}')
     output_dir.mkdir(exist_ok=True)
     
@@ -1463,33 +1583,30 @@ async def main():
         print("  📝 Generating article...")
         article = generate_article_with_gemini(topic, gemini_key)
         
-        # Generate hero image
-        hero_image = image_gen.generate_hero_image(topic['keyword'])
-        hero_base64 = base64.b64encode(hero_image).decode('utf-8')
+        slug = topic['_slug'] = _slugify(topic['title'])
+        
+        # Generate hero image next to the article
+        hero_photo = await image_gen.fetch_hero_photo(topic['keyword'])
+        hero_image = _brand_image_bytes(hero_photo, 1200, 630)
+        (blog_dir / f'hero-{slug}.jpg').write_bytes(hero_image)
         
         # Create HTML
-        slug = topic['title'].lower().replace(' ', '-').replace("'", '').replace(':', '')[:60]
-        html = create_professional_html(article, topic, hero_base64, slug)
+        html = create_professional_html(article, topic, slug, article_date)
         
-        with open(blog_dir / f'{slug}.html', 'w', encoding='utf-8') as f:
-            f.write(html)
+        (blog_dir / f'{slug}.html').write_bytes(html.encode('utf-8'))
         
         # Generate podcast
         if EDGE_TTS_AVAILABLE:
             try:
-                podcast = await podcast_gen.generate_podcast(article, topic, i)
+                podcast_filename = f'episode-{i:02d}-{slug[:30]}.mp3'
+                podcast_file = podcast_dir / podcast_filename
+                podcast = await podcast_gen.generate_podcast(article, topic, i, podcast_file)
                 if podcast:
-                    podcast_filename = f'episode-{i:02d}-{slug[:30]}.mp3'
-                    podcast_file = podcast_dir / podcast_filename
-                    
-                    with open(podcast_file, 'wb') as f:
-                        f.write(podcast['audio'])
-                    
                     podcasts_list.append({
                         'title': topic['title'],
                         'episode': i,
                         'filename': podcast_filename,
-                        'size': len(podcast['audio']),
+                        'size': podcast['size'],
                         'duration': podcast['duration']
                     })
             except Exception as e:
@@ -1548,7 +1665,7 @@ async def main():
     <div class="container">
         <div class="header">
             <div class="logo">Say<span>Play</span> Dashboard</div>
-            <div class="date">{datetime.now().strftime("%B %d, %Y %H:%M UTC")}</div>
+            <div class="date">{dashboard_date}</div>
         </div>
         
         <div class="stats">